@@ -4,6 +4,8 @@ Used as test oracles by cocotb testbenches. Every hardware output is
 cross-checked against these functions.
 """
 
+import struct
+
 KYBER_Q = 3329
 KYBER_N = 256
 KYBER_N_INV = 3303     # 128^-1 mod 3329 (INTT scaling factor)
@@ -123,6 +125,44 @@ def decompress_q(y: int, d: int) -> int:
     return (KYBER_Q * y + (1 << (d - 1))) >> d
 
 
+# Whole-domain compress/decompress tables per Kyber D value:
+# _COMPRESS_TABLE[d][x] == compress_q(x, d), _DECOMPRESS_TABLE[d][y] == decompress_q(y, d)
+_COMPRESS_TABLE = {
+    d: [(((x << d) + HALF_Q) // KYBER_Q) & ((1 << d) - 1) for x in range(KYBER_Q)]
+    for d in (1, 4, 5, 10, 11)
+}
+_DECOMPRESS_TABLE = {
+    d: [(KYBER_Q * y + (1 << (d - 1))) >> d for y in range(1 << d)]
+    for d in (1, 4, 5, 10, 11)
+}
+
+
+def poly_compress(a: list, d: int) -> list:
+    """Compress all 256 coefficients of a polynomial with compress_q(., d).
+
+    Validates once per polynomial rather than once per coefficient, then
+    looks each coefficient up in the precomputed table for D.
+    """
+    assert len(a) == KYBER_N
+    assert d in (1, 4, 5, 10, 11), f"poly_compress d={d} not a valid Kyber D value"
+    assert min(a) >= 0 and max(a) < KYBER_Q, "poly_compress input out of range"
+    table = _COMPRESS_TABLE[d]
+    return [table[c] for c in a]
+
+
+def poly_decompress(a: list, d: int) -> list:
+    """Decompress all 256 coefficients of a polynomial with decompress_q(., d).
+
+    Validates once per polynomial rather than once per coefficient, then
+    looks each coefficient up in the precomputed table for D.
+    """
+    assert len(a) == KYBER_N
+    assert d in (1, 4, 5, 10, 11), f"poly_decompress d={d} not a valid Kyber D value"
+    assert min(a) >= 0 and max(a) < (1 << d), "poly_decompress input out of range"
+    table = _DECOMPRESS_TABLE[d]
+    return [table[y] for y in a]
+
+
 def ntt_butterfly(even: int, odd: int, zeta: int) -> tuple:
     """NTT Cooley-Tukey butterfly.
 
@@ -209,19 +249,43 @@ def poly_basemul(a: list, b: list) -> list:
     Matches the pq-crystals C reference (poly.c: poly_basemul_montgomery).
     """
     assert len(a) == KYBER_N and len(b) == KYBER_N
+    q = KYBER_Q
     r = [0] * KYBER_N
 
+    # Inlined basemul() with plain % arithmetic (bit-identical, no per-pair calls)
     for i in range(64):
         zeta = ZETAS[64 + i]
-        neg_zeta = KYBER_Q - zeta  # -zeta mod q
+        for base, z in ((4 * i, zeta), (4 * i + 2, q - zeta)):  # +zeta, then -zeta
+            a0, a1 = a[base], a[base + 1]
+            b0, b1 = b[base], b[base + 1]
+            r[base] = (a0 * b0 + (a1 * b1 % q) * z) % q
+            r[base + 1] = (a0 * b1 + a1 * b0) % q
+
+    return r
 
-        # +zeta basemul on coefficients [4i, 4i+1]
-        r[4*i], r[4*i+1] = basemul(a[4*i], a[4*i+1], b[4*i], b[4*i+1], zeta)
 
-        # -zeta basemul on coefficients [4i+2, 4i+3]
-        r[4*i+2], r[4*i+3] = basemul(a[4*i+2], a[4*i+3], b[4*i+2], b[4*i+3], neg_zeta)
+def poly_basemul_acc(a_polys: list, b_polys: list) -> list:
+    """Inner product of NTT-domain polynomial vectors: sum_j a_j * b_j.
 
-    return r
+    Equivalent to chaining poly_basemul and poly_add over the pairs, but the
+    products are accumulated unreduced and each coefficient is reduced once
+    at the end, instead of materializing and reducing every partial result.
+    """
+    assert len(a_polys) == len(b_polys)
+    q = KYBER_Q
+    r = [0] * KYBER_N
+
+    for a, b in zip(a_polys, b_polys):
+        assert len(a) == KYBER_N and len(b) == KYBER_N
+        for i in range(64):
+            zeta = ZETAS[64 + i]
+            for base, z in ((4 * i, zeta), (4 * i + 2, q - zeta)):  # +zeta, then -zeta
+                a0, a1 = a[base], a[base + 1]
+                b0, b1 = b[base], b[base + 1]
+                r[base] += a0 * b0 + (a1 * b1 % q) * z
+                r[base + 1] += a0 * b1 + a1 * b0
+
+    return [c % q for c in r]
 
 
 def schoolbook_mul(a: list, b: list) -> list:
@@ -231,17 +295,18 @@ def schoolbook_mul(a: list, b: list) -> list:
     equal schoolbook_mul(a, b).
     """
     assert len(a) == KYBER_N and len(b) == KYBER_N
-    c = [0] * (2 * KYBER_N)
-    for i in range(KYBER_N):
-        for j in range(KYBER_N):
-            c[i + j] += a[i] * b[j]
+    # Reduce first: the packing below needs every coefficient in [0, q)
+    a = [x % KYBER_Q for x in a]
+    b = [x % KYBER_Q for x in b]
+    # Kronecker substitution: pack each polynomial into one integer with
+    # 32-bit digits and let CPython's bignum multiply do the convolution.
+    # Every convolution sum is < 256 * q^2 < 2^32, so digits never carry.
+    pa = int.from_bytes(struct.pack(f'<{KYBER_N}I', *a), 'little')
+    pb = int.from_bytes(struct.pack(f'<{KYBER_N}I', *b), 'little')
+    c = struct.unpack(f'<{2 * KYBER_N}I', (pa * pb).to_bytes(8 * KYBER_N, 'little'))
 
     # Reduce mod X^256 + 1: c[i+256] wraps with negation
-    r = [0] * KYBER_N
-    for i in range(KYBER_N):
-        r[i] = (c[i] - c[i + KYBER_N]) % KYBER_Q
-
-    return r
+    return [(c[i] - c[i + KYBER_N]) % KYBER_Q for i in range(KYBER_N)]
 
 
 def cbd_sample_eta2(input_bytes: list) -> list:
@@ -256,16 +321,24 @@ def cbd_sample_eta2(input_bytes: list) -> list:
     assert len(input_bytes) == 128, f"CBD η=2 requires 128 bytes, got {len(input_bytes)}"
     coeffs = []
     for byte_val in input_bytes:
-        for shift in (0, 4):  # low nibble, then high nibble
-            nibble = (byte_val >> shift) & 0xF
-            a = (nibble & 1) + ((nibble >> 1) & 1)      # b0 + b1
-            b = ((nibble >> 2) & 1) + ((nibble >> 3) & 1)  # b2 + b3
-            coeff = (a - b) % KYBER_Q
-            coeffs.append(coeff)
+        coeffs += _CBD_ETA2_PAIRS[byte_val]
     return coeffs
 
 
-def keygen_inner(A_hat, s_noise, e_noise):
+def _cbd_eta2_nibble(nibble: int) -> int:
+    """CBD η=2 coefficient for one nibble: (b0+b1) - (b2+b3) mod q."""
+    a = (nibble & 1) + ((nibble >> 1) & 1)          # b0 + b1
+    b = ((nibble >> 2) & 1) + ((nibble >> 3) & 1)   # b2 + b3
+    return (a - b) % KYBER_Q
+
+
+# (low nibble, high nibble) coefficients for every byte value
+_CBD_ETA2_PAIRS = [
+    (_cbd_eta2_nibble(v & 0xF), _cbd_eta2_nibble(v >> 4)) for v in range(256)
+]
+
+
+def keygen_inner(A_hat, s_noise, e_noise, s_hat=None, e_hat=None):
     """ML-KEM-768 key generation inner function (deterministic).
 
     Computes t_hat = A_hat * NTT(s) + NTT(e) in the NTT domain.
@@ -274,6 +347,8 @@ def keygen_inner(A_hat, s_noise, e_noise):
         A_hat: 3x3 list of NTT-domain polynomials. A_hat[j][i] is row j, col i.
         s_noise: list of 3 time-domain noise polynomials (CBD sampled).
         e_noise: list of 3 time-domain noise polynomials (CBD sampled).
+        s_hat, e_hat: optional precomputed NTT(s) and NTT(e), for callers that
+            also need them as oracles; computed from the noise when omitted.
 
     Returns:
         (t_hat, s_hat): t_hat is list of 3 NTT-domain polynomials,
@@ -283,18 +358,13 @@ def keygen_inner(A_hat, s_noise, e_noise):
     A^T * r_hat (column access). Same A_hat layout, different traversal.
     """
     # NTT(s) and NTT(e)
-    s_hat = [ntt_forward(s_noise[i]) for i in range(3)]
-    e_hat = [ntt_forward(e_noise[i]) for i in range(3)]
+    if s_hat is None:
+        s_hat = [ntt_forward(s_noise[i]) for i in range(3)]
+    if e_hat is None:
+        e_hat = [ntt_forward(e_noise[i]) for i in range(3)]
 
     # t_hat[i] = sum_j A_hat[i][j] * s_hat[j] + e_hat[i]  (row i of A)
-    t_hat = []
-    for i in range(3):
-        acc = poly_basemul(A_hat[i][0], s_hat[0])
-        for j in range(1, 3):
-            temp = poly_basemul(A_hat[i][j], s_hat[j])
-            acc = poly_add(acc, temp)
-        acc = poly_add(acc, e_hat[i])
-        t_hat.append(acc)
+    t_hat = [poly_add(poly_basemul_acc(A_hat[i], s_hat), e_hat[i]) for i in range(3)]
 
     return t_hat, s_hat
 
@@ -334,12 +404,12 @@ def decrypt_inner(s_hat, u_compressed, v_compressed):
     diff = poly_sub(v, w)
 
     # Compress D=1 → message bits
-    m_prime = [compress_q(c, 1) for c in diff]
+    m_prime = poly_compress(diff, 1)
 
     return m_prime
 
 
-def encaps_inner(A_hat, t_hat, r, e1, e2, m):
+def encaps_inner(A_hat, t_hat, r, e1, e2, m, r_hat=None):
     """ML-KEM-768 encapsulation inner function (deterministic).
 
     Performs the core encapsulation computation, matching the hardware
@@ -352,13 +422,16 @@ def encaps_inner(A_hat, t_hat, r, e1, e2, m):
         e1: list of 3 time-domain noise polynomials (CBD sampled).
         e2: time-domain noise polynomial (CBD sampled).
         m: time-domain message polynomial (decompressed from 32-byte message).
+        r_hat: optional precomputed NTT(r), for callers that also need it as
+            an oracle; computed from r when omitted.
 
     Returns:
         (u, v): u is list of 3 uncompressed polynomials, v is uncompressed polynomial.
         Caller applies compress separately if needed.
     """
     # Phase 1: NTT(r)
-    r_hat = [ntt_forward(r[i]) for i in range(3)]
+    if r_hat is None:
+        r_hat = [ntt_forward(r[i]) for i in range(3)]
 
     # Phase 2: u = INTT(A_hat^T * r_hat) + e1
     u = []
@@ -389,25 +462,36 @@ def ntt_forward(coeffs: list) -> list:
 
     Transforms a 256-element polynomial from coefficient domain to NTT domain.
     Uses 7 layers of 128 butterflies each.
+
+    The butterfly is inlined with plain % arithmetic rather than calling
+    barrett_reduce/mod_add/mod_sub per element. Those helpers are exact for
+    every in-range operand, so the output is bit-identical; this only removes
+    ~2,700 Python calls (896 butterflies × 3 helpers, with their range
+    asserts) per transform.
+
+    Reduction is lazy: only the twiddle product is reduced inside the loop,
+    the add/sub results are left unreduced (Python ints cannot overflow, and
+    grow by less than q per layer), and every coefficient is reduced once
+    at the end. Same result mod q, two fewer % per butterfly.
     """
     assert len(coeffs) == KYBER_N
-    f = [c % KYBER_Q for c in coeffs]
+    q = KYBER_Q
+    f = list(coeffs)
 
     k = 1
     length = 128
     while length >= 2:
-        start = 0
-        while start < KYBER_N:
+        for start in range(0, KYBER_N, 2 * length):
             zeta = ZETAS[k]
             k += 1
             for j in range(start, start + length):
-                t = barrett_reduce(zeta * f[j + length])
-                f[j + length] = mod_sub(f[j], t)
-                f[j] = mod_add(f[j], t)
-            start += 2 * length
+                t = zeta * f[j + length] % q
+                fj = f[j]
+                f[j + length] = fj - t
+                f[j] = fj + t
         length >>= 1
 
-    return f
+    return [c % q for c in f]
 
 
 def ntt_inverse(coeffs: list) -> list:
@@ -415,26 +499,27 @@ def ntt_inverse(coeffs: list) -> list:
 
     Transforms a 256-element polynomial from NTT domain back to coefficient domain.
     Uses 7 layers of 128 butterflies each, followed by scaling by 128^-1 mod q.
+
+    Inlined with plain % arithmetic and lazy reduction like ntt_forward:
+    the sums are left unreduced until the final scaling, which reduces every
+    coefficient mod q anyway. Bit-identical output.
     """
     assert len(coeffs) == KYBER_N
-    f = [c % KYBER_Q for c in coeffs]
+    q = KYBER_Q
+    f = list(coeffs)
 
     k = 127
     length = 2
     while length <= 128:
-        start = 0
-        while start < KYBER_N:
+        for start in range(0, KYBER_N, 2 * length):
             zeta = ZETAS[k]
             k -= 1
             for j in range(start, start + length):
                 t = f[j]
-                f[j] = mod_add(t, f[j + length])
-                f[j + length] = barrett_reduce(zeta * mod_sub(f[j + length], t))
-            start += 2 * length
+                u = f[j + length]
+                f[j] = t + u
+                f[j + length] = zeta * (u - t) % q
         length <<= 1
 
     # Scale all coefficients by 128^-1 mod q
-    for i in range(KYBER_N):
-        f[i] = barrett_reduce(f[i] * KYBER_N_INV)
-
-    return f
+    return [c * KYBER_N_INV % q for c in f]
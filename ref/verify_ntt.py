@@ -12,7 +12,7 @@ import os
 sys.path.insert(0, os.path.dirname(__file__))
 from kyber_math import (
     KYBER_Q, KYBER_N, KYBER_N_INV, ZETAS,
-    ntt_forward, ntt_inverse, bitrev7, mod_q,
+    ntt_forward, ntt_inverse, bitrev7, mod_q, schoolbook_mul,
 )
 
 
@@ -105,6 +105,39 @@ def test_linearity():
     print("PASS: NTT linearity verified (100 tests)")
 
 
+def naive_mul(a, b):
+    """O(n^2) negacyclic convolution mod (X^256 + 1), the schoolbook_mul oracle."""
+    c = [0] * KYBER_N
+    for i in range(KYBER_N):
+        for j in range(KYBER_N):
+            if i + j < KYBER_N:
+                c[i + j] += a[i] * b[j]
+            else:
+                c[i + j - KYBER_N] -= a[i] * b[j]
+    return [x % KYBER_Q for x in c]
+
+
+def test_schoolbook_mul():
+    """schoolbook_mul matches the naive convolution, including unreduced inputs."""
+    rng = random.Random(31)
+    cases = [
+        ([KYBER_Q - 1] * KYBER_N, [KYBER_Q - 1] * KYBER_N),
+        ([4200] * KYBER_N, [60000] * KYBER_N),
+        ([-1] * KYBER_N, [-KYBER_Q - 5] * KYBER_N),
+    ]
+    for _ in range(20):
+        cases.append(([rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)],
+                      [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]))
+    for _ in range(10):
+        cases.append(([rng.randint(-2**20, 2**20) for _ in range(KYBER_N)],
+                      [rng.randint(-2**20, 2**20) for _ in range(KYBER_N)]))
+
+    for a, b in cases:
+        assert schoolbook_mul(a, b) == naive_mul(a, b), "schoolbook_mul mismatch"
+
+    print(f"PASS: schoolbook_mul vs naive convolution ({len(cases)} tests)")
+
+
 def test_cross_check_kyber_py():
     """Cross-check against kyber-py reference package."""
     try:
@@ -136,5 +169,6 @@ if __name__ == "__main__":
     test_known_vectors()
     test_round_trip()
     test_linearity()
+    test_schoolbook_mul()
     test_cross_check_kyber_py()
     print("\nAll NTT verification tests passed!")
@@ -54,6 +54,7 @@ module kyber_top (
     localparam OP_COMPRESS      = 4'd10;
     localparam OP_DECOMPRESS    = 4'd11;
     localparam OP_CBD_SAMPLE    = 4'd12;
+    localparam OP_NTT_WITH_COPY = 4'd13;  // COPY_TO_NTT(a) + RUN_NTT + COPY_FROM_NTT(b)
 
     // FSM states
     localparam S_IDLE     = 3'd0;
@@ -71,9 +72,18 @@ module kyber_top (
     reg [4:0]  slot_a_reg;
     reg [4:0]  slot_b_reg;
     reg [3:0]  param_reg;
+    reg [1:0]  phase;         // OP_NTT_WITH_COPY: 0=copy in, 1=run, 2=copy out
 
     assign busy = (state != S_IDLE);
 
+    // OP_NTT_WITH_COPY reuses the S_COPY/S_RUN datapaths, acting as the
+    // corresponding single op in each phase and writing back to slot_b
+    wire       fused_ntt = (op_reg == OP_NTT_WITH_COPY);
+    wire [3:0] copy_op   = fused_ntt ? ((phase == 2'd0) ? OP_COPY_TO_NTT : OP_COPY_FROM_NTT)
+                                     : op_reg;
+    wire [3:0] run_op    = fused_ntt ? OP_RUN_NTT : op_reg;
+    wire [4:0] copy_dst  = fused_ntt ? slot_b_reg : slot_a_reg;
+
     // ─── Bank RAM signals ─────────────────────────────────────────
     // Port A: broadcast addr/din, selective we per slot
     wire [7:0]  bank_addr_a;
@@ -287,6 +297,7 @@ module kyber_top (
             slot_a_reg <= 5'd0;
             slot_b_reg <= 5'd0;
             param_reg  <= 4'd0;
+            phase      <= 2'd0;
         end else begin
             done <= 1'b0;
 
@@ -298,6 +309,7 @@ module kyber_top (
                         slot_b_reg <= cmd_slot_b;
                         param_reg  <= cmd_param;
                         counter    <= 9'd0;
+                        phase      <= 2'd0;
 
                         case (cmd_op)
                             OP_NOP: begin
@@ -305,7 +317,7 @@ module kyber_top (
                             end
                             OP_COPY_TO_NTT, OP_COPY_FROM_NTT,
                             OP_COPY_TO_BM_A, OP_COPY_TO_BM_B,
-                            OP_COPY_FROM_BM: begin
+                            OP_COPY_FROM_BM, OP_NTT_WITH_COPY: begin
                                 state <= S_COPY;
                             end
                             OP_RUN_NTT, OP_RUN_BASEMUL: begin
@@ -327,9 +339,15 @@ module kyber_top (
 
                 // ─── Copy: 257 cycles (0=prime read, 1..256=write) ───
                 S_COPY: begin
-                    if (counter == 9'd256)
-                        state <= S_DONE;
-                    else
+                    if (counter == 9'd256) begin
+                        if (fused_ntt && phase == 2'd0) begin
+                            // Copy-in finished: start the NTT directly
+                            counter <= 9'd0;
+                            phase   <= 2'd1;
+                            state   <= S_RUN;
+                        end else
+                            state <= S_DONE;
+                    end else
                         counter <= counter + 9'd1;
                 end
 
@@ -339,8 +357,13 @@ module kyber_top (
                         // Start pulse was generated combinationally; advance
                         counter <= 9'd1;
                     end else begin
-                        if ((op_reg == OP_RUN_NTT && ntt_done) ||
-                            (op_reg == OP_RUN_BASEMUL && bm_done))
+                        if (fused_ntt && ntt_done) begin
+                            // NTT finished: copy the result out to slot_b
+                            counter <= 9'd0;
+                            phase   <= 2'd2;
+                            state   <= S_COPY;
+                        end else if ((op_reg == OP_RUN_NTT && ntt_done) ||
+                                     (op_reg == OP_RUN_BASEMUL && bm_done))
                             state <= S_DONE;
                     end
                 end
@@ -416,7 +439,7 @@ module kyber_top (
         case (state)
             // ─── Copy operations ──────────────────────────────────
             S_COPY: begin
-                case (op_reg)
+                case (copy_op)
                     OP_COPY_TO_NTT: begin
                         // Read bank[slot_a] Port A → write NTT ext port
                         fsm_addr_a = counter[7:0];      // present next address
@@ -431,10 +454,11 @@ module kyber_top (
 
                     OP_COPY_FROM_NTT: begin
                         // Read NTT ext port → write bank[slot_a] Port A
+                        // (bank[slot_b] for OP_NTT_WITH_COPY)
                         ntt_ext_addr = counter[7:0];    // present next address
                         if (counter > 9'd0) begin
                             fsm_we_a_flag = 1'b1;
-                            fsm_we_a_slot = slot_a_reg;
+                            fsm_we_a_slot = copy_dst;
                             fsm_addr_a    = counter[7:0] - 8'd1;
                             fsm_din_a     = ntt_ext_dout;
                         end
@@ -478,7 +502,7 @@ module kyber_top (
             // ─── Run sub-engine ───────────────────────────────────
             S_RUN: begin
                 if (counter == 9'd0) begin
-                    case (op_reg)
+                    case (run_op)
                         OP_RUN_NTT:     ntt_start = 1'b1;
                         OP_RUN_BASEMUL: bm_start  = 1'b1;
                         default: begin end
@@ -0,0 +1,41 @@
+// cbd_sampler_tb_wrapper — cbd_sampler with an HDL-side clock generator
+//
+// Generates the 10 ns testbench clock in Verilog so cocotb does not have to
+// write clk through VPI every half period. clk stays visible as an internal
+// signal for the testbench's edge triggers.
+
+module cbd_sampler_tb_wrapper (
+    input  wire        rst_n,
+
+    // Control
+    input  wire        start,
+    output wire        done,
+    output wire        busy,
+
+    // Byte stream input (valid/ready handshake)
+    input  wire        byte_valid,
+    input  wire [7:0]  byte_data,
+    output wire        byte_ready,
+
+    // Result polynomial read port
+    input  wire [7:0]  r_addr,
+    output wire [11:0] r_dout
+);
+
+    reg clk = 1'b0;
+    always #5 clk = ~clk;
+
+    cbd_sampler u_dut (
+        .clk        (clk),
+        .rst_n      (rst_n),
+        .start      (start),
+        .done       (done),
+        .busy       (busy),
+        .byte_valid (byte_valid),
+        .byte_data  (byte_data),
+        .byte_ready (byte_ready),
+        .r_addr     (r_addr),
+        .r_dout     (r_dout)
+    );
+
+endmodule
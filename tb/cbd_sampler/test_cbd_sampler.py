@@ -13,19 +13,18 @@ import os
 import random
 
 import cocotb
-from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, ReadOnly, SimTimeoutError, with_timeout
+from cocotb.utils import get_sim_time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
 from kyber_math import KYBER_Q, KYBER_N, cbd_sample_eta2
 
 
-CLK_PERIOD_NS = 10
+CLK_PERIOD_NS = 10  # Must match the wrapper's always #5 clock
 
 
 async def init(dut):
-    """Start clock, assert reset, release."""
-    cocotb.start_soon(Clock(dut.clk, CLK_PERIOD_NS, unit='ns').start())
+    """Assert reset, release. The clock is generated by the HDL wrapper."""
     dut.rst_n.value = 0
     dut.start.value = 0
     dut.byte_valid.value = 0
@@ -37,57 +36,54 @@ async def init(dut):
     await RisingEdge(dut.clk)
 
 
-async def run_sampler(dut, data, stall_pattern=None):
-    """Start sampler, feed 128 bytes, wait for done. Returns cycle count.
+async def feed_bytes(dut, data, stall_pattern=None):
+    """Present data on the byte_valid/byte_ready handshake until all are taken.
 
+    byte_ready is sampled in the ReadOnly phase before each clock edge, so a
+    byte counts as accepted on the edge it was presented with ready high.
     stall_pattern: if provided, a list of booleans (length 128).
     If stall_pattern[i] is True, deassert byte_valid for 1 cycle before byte i.
+    The pattern is packed into an int bitmask up front so the per-byte check
+    is a shift-and-mask rather than a list lookup.
     """
-    stalls = list(stall_pattern) if stall_pattern else None
+    stall_mask = sum(1 << i for i, stall in enumerate(stall_pattern or ()) if stall)
+    for i, byte_val in enumerate(data):
+        if stall_mask >> i & 1:
+            dut.byte_valid.value = 0
+            await RisingEdge(dut.clk)
+        dut.byte_valid.value = 1
+        dut.byte_data.value = byte_val
+        while True:
+            await ReadOnly()
+            accepted = dut.byte_ready.value == 1
+            await RisingEdge(dut.clk)
+            if accepted:
+                break
+    dut.byte_valid.value = 0
+
 
+async def run_sampler(dut, data, stall_pattern=None):
+    """Start sampler, feed 128 bytes, wait for done. Returns cycle count.
+
+    Bytes are driven by a forked feed_bytes task; this coroutine only waits
+    for the rising edge of done, and derives the cycle count from sim time.
+    """
     # Pulse start
     dut.start.value = 1
     await RisingEdge(dut.clk)
     dut.start.value = 0
+    start_ns = get_sim_time(unit='ns')
 
-    byte_idx = 0
-    cycles = 0
-    presenting = False  # True when byte_valid is high with valid data
-
-    while True:
-        # Decide what to drive this cycle
-        if byte_idx < 128:
-            if stalls and stalls[byte_idx]:
-                # Stall: deassert byte_valid for this cycle
-                dut.byte_valid.value = 0
-                stalls[byte_idx] = False
-                presenting = False
-            else:
-                dut.byte_valid.value = 1
-                dut.byte_data.value = data[byte_idx]
-                presenting = True
-        else:
-            dut.byte_valid.value = 0
-            presenting = False
-
-        await RisingEdge(dut.clk)
-        cycles += 1
-
-        await FallingEdge(dut.clk)
-        if dut.done.value == 1:
-            dut.byte_valid.value = 0
-            break
-
-        # If we were presenting a byte and it was accepted, advance
-        if presenting and dut.byte_ready.value == 1:
-            byte_idx += 1
+    feeder = cocotb.start_soon(feed_bytes(dut, data, stall_pattern))
+    try:
+        await with_timeout(RisingEdge(dut.done), 2000 * CLK_PERIOD_NS, 'ns')
+    except SimTimeoutError:
+        raise RuntimeError("Timeout: cbd_sampler did not assert done within 2000 cycles")
+    finally:
+        feeder.cancel()
 
-        if cycles > 2000:
-            raise RuntimeError(
-                f"Timeout: cbd_sampler did not assert done within 2000 cycles (byte_idx={byte_idx})"
-            )
-
-    return cycles
+    dut.byte_valid.value = 0
+    return round((get_sim_time(unit='ns') - start_ns) / CLK_PERIOD_NS)
 
 
 async def read_result(dut, count=256):
@@ -102,7 +98,12 @@ async def read_result(dut, count=256):
 
 
 def check_coeffs(dut, result, expected, label):
-    """Compare result against expected, log errors."""
+    """Compare result against expected, log errors.
+
+    Fast path: one C-level list comparison when everything matches.
+    """
+    if list(result) == list(expected):
+        return 0
     errors = 0
     for i in range(len(expected)):
         if result[i] != expected[i]:
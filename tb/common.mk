@@ -5,15 +5,39 @@
 #   TOPLEVEL             — Top-level module name
 #   COCOTB_TEST_MODULES  — Python test module name
 #
+# Optional per-test override (set before the include):
+#   SIM                  — Simulator; defaults to icarus. The purely combinational
+#                          exhaustive testbenches select verilator.
+#
 # Built-in VCD/FST support:
-#   make WAVES=1    — Dumps <toplevel>.fst in the build directory (Icarus FST format)
+#   make WAVES=1    — Icarus: dumps <toplevel>.fst in the build directory
+#                     Verilator: dumps dump.fst in the test directory
 #   Viewable with GTKWave: gtkwave sim_build/<toplevel>.fst
 
 SIM ?= icarus
 TOPLEVEL_LANG ?= verilog
 
-VERILOG_INCLUDE_DIRS = $(PWD)/../../rtl
+VERILOG_INCLUDE_DIRS = $(CURDIR)/../../rtl
 
 COCOTB_RESULTS_FILE = results.xml
 
+# Verilator: compile the DUT to optimized C++ running in-process with cocotb
+ifeq ($(SIM),verilator)
+COMPILE_ARGS += -O3 --x-assign fast --x-initial fast --threads 1
+COMPILE_ARGS += -Wno-fatal    # RTL is linted for Icarus; keep width warnings non-fatal
+ifeq ($(WAVES),1)
+COMPILE_ARGS += --trace-fst
+SIM_ARGS     += --trace
+endif
+endif
+
 include $(shell cocotb-config --makefiles)/Makefile.sim
+
+# Compile without running, so several COCOTB_TEST_FILTER runs can share one
+# SIM_BUILD (used by the top-level per-test kyber_top/keygen_top targets)
+.PHONY: build
+ifeq ($(SIM),verilator)
+build: $(SIM_BUILD)/Vtop
+else ifeq ($(SIM),icarus)
+build: $(SIM_BUILD)/sim.vvp
+endif
@@ -29,9 +29,9 @@ RESULT_SIGNALS = {
 
 
 async def drive_and_check(dut, x, d):
-    """Drive x input, wait for combinational settle, check result for given D."""
+    """Drive x input, wait one simulation step, check result for given D."""
     dut.x.value = x
-    await Timer(1, unit='ns')
+    await Timer(1, unit='step')
     sig = getattr(dut, RESULT_SIGNALS[d])
     val = sig.value
     result = int(val == 1) if d == 1 else val.to_unsigned()
@@ -111,12 +111,13 @@ async def test_round_trip(dut):
     The maximum round-trip error is ceil(q / 2^(d+1)).
     """
     errors = 0
+    x_sig = dut.x
     for d in D_VALUES:
         max_error = math.ceil(KYBER_Q / (1 << (d + 1)))
         worst_error = 0
         for x in range(KYBER_Q):
-            dut.x.value = x
-            await Timer(1, unit='ns')
+            x_sig.value = x
+            await Timer(1, unit='step')
             sig = getattr(dut, RESULT_SIGNALS[d])
             val = sig.value
             compressed = int(val == 1) if d == 1 else val.to_unsigned()
@@ -16,9 +16,9 @@ from kyber_math import KYBER_Q, cond_add_q, mod_q
 
 
 async def drive_and_check(dut, a, expected):
-    """Drive input a, wait for combinational propagation, check result."""
+    """Drive input a, wait one simulation step, check result."""
     dut.a.value = a
-    await Timer(1, unit='ns')
+    await Timer(1, unit='step')
     result = dut.result.value.to_unsigned()
     assert result == expected, (
         f"FAIL: cond_add_q({a}) = {result}, expected {expected}"
@@ -29,10 +29,11 @@ async def drive_and_check(dut, a, expected):
 async def test_exhaustive_all_13bit(dut):
     """Test all 8192 possible 13-bit inputs."""
     errors = 0
+    a_sig = dut.a
     for a in range(2**13):
         expected = cond_add_q(a)
-        dut.a.value = a
-        await Timer(1, unit='ns')
+        a_sig.value = a
+        await Timer(1, unit='step')
         result = dut.result.value.to_unsigned()
         if result != expected:
             dut._log.error(f"FAIL: cond_add_q({a}) = {result}, expected {expected}")
@@ -78,6 +79,7 @@ async def test_random_subtraction_pairs(dut):
     rng = random.Random(42)
     n_samples = 100_000
     errors = 0
+    a_sig = dut.a
 
     for _ in range(n_samples):
         a = rng.randint(0, KYBER_Q - 1)
@@ -85,8 +87,8 @@ async def test_random_subtraction_pairs(dut):
         diff = ((1 << 13) + a - b) if a < b else (a - b)
         diff &= 0x1FFF
         expected = (a - b) % KYBER_Q
-        dut.a.value = diff
-        await Timer(1, unit='ns')
+        a_sig.value = diff
+        await Timer(1, unit='step')
         result = dut.result.value.to_unsigned()
         if result != expected:
             dut._log.error(
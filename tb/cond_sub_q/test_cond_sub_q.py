@@ -15,9 +15,9 @@ from kyber_math import KYBER_Q, mod_q
 
 
 async def drive_and_check(dut, a, expected):
-    """Drive input a, wait for combinational propagation, check result."""
+    """Drive input a, wait one simulation step, check result."""
     dut.a.value = a
-    await Timer(1, unit='ns')
+    await Timer(1, unit='step')
     result = dut.result.value.to_unsigned()
     assert result == expected, (
         f"FAIL: cond_sub_q({a}) = {result}, expected {expected}"
@@ -28,10 +28,11 @@ async def drive_and_check(dut, a, expected):
 async def test_exhaustive_valid_range(dut):
     """Test all inputs in [0, 2q-1] = [0, 6657]."""
     errors = 0
+    a_sig = dut.a
     for a in range(2 * KYBER_Q):
         expected = mod_q(a)
-        dut.a.value = a
-        await Timer(1, unit='ns')
+        a_sig.value = a
+        await Timer(1, unit='step')
         result = dut.result.value.to_unsigned()
         if result != expected:
             dut._log.error(f"FAIL: cond_sub_q({a}) = {result}, expected {expected}")
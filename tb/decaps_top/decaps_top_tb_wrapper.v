@@ -0,0 +1,40 @@
+// decaps_top_tb_wrapper — decaps_top with an HDL-side clock generator
+//
+// Generates the 10 ns testbench clock in Verilog so cocotb does not have to
+// write clk through VPI every half period (~200k value changes per decrypt
+// run). clk stays visible as an internal signal for the testbench's edge
+// triggers.
+
+module decaps_top_tb_wrapper (
+    input  wire        rst_n,
+
+    // Host polynomial I/O
+    input  wire        host_we,
+    input  wire [4:0]  host_slot,
+    input  wire [7:0]  host_addr,
+    input  wire [11:0] host_din,
+    output wire [11:0] host_dout,
+
+    // Decrypt control
+    input  wire        decrypt_start,
+    output wire        decrypt_done,
+    output wire        decrypt_busy
+);
+
+    reg clk = 1'b0;
+    always #5 clk = ~clk;
+
+    decaps_top u_dut (
+        .clk           (clk),
+        .rst_n         (rst_n),
+        .host_we       (host_we),
+        .host_slot     (host_slot),
+        .host_addr     (host_addr),
+        .host_din      (host_din),
+        .host_dout     (host_dout),
+        .decrypt_start (decrypt_start),
+        .decrypt_done  (decrypt_done),
+        .decrypt_busy  (decrypt_busy)
+    );
+
+endmodule
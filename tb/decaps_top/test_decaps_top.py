@@ -16,7 +16,6 @@ import os
 import random
 
 import cocotb
-from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, FallingEdge
 
 # Add ref/ to path for oracle functions
@@ -30,12 +29,9 @@ from kyber_math import (
     cbd_sample_eta2, keygen_inner, encaps_inner, decrypt_inner,
 )
 
-CLK_PERIOD_NS = 10
-
 
 async def init(dut):
-    """Start clock, assert reset, release."""
-    cocotb.start_soon(Clock(dut.clk, CLK_PERIOD_NS, unit='ns').start())
+    """Assert reset, release. The clock is generated by the HDL wrapper."""
     dut.rst_n.value = 0
     dut.host_we.value = 0
     dut.host_slot.value = 0
@@ -74,6 +70,8 @@ async def read_poly(dut, slot):
 
 def compare_polys(got, expected, label, log, max_errors=10):
     """Compare two polynomials, return error count."""
+    if list(got) == list(expected):
+        return 0
     errors = 0
     for i in range(KYBER_N):
         if got[i] != expected[i]:
@@ -87,12 +85,18 @@ def compare_polys(got, expected, label, log, max_errors=10):
 
 def gen_random_poly(rng):
     """Generate a random polynomial in [0, q-1]."""
-    return [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    return gen_random_polys(rng, 1)[0]
+
+
+def gen_random_polys(rng, count):
+    """Generate count random polynomials in [0, q-1] from one bulk RNG draw."""
+    flat = rng.choices(range(KYBER_Q), k=count * KYBER_N)
+    return [flat[i * KYBER_N:(i + 1) * KYBER_N] for i in range(count)]
 
 
 def gen_cbd_bytes(rng):
     """Generate 128 random bytes for CBD sampling."""
-    return [rng.randint(0, 255) for _ in range(128)]
+    return list(rng.randbytes(128))
 
 
 def gen_keygen_encaps_data(rng):
@@ -106,7 +110,8 @@ def gen_keygen_encaps_data(rng):
         m_prime_oracle: oracle-decrypted message
     """
     # KeyGen
-    A_hat = [[gen_random_poly(rng) for j in range(3)] for i in range(3)]
+    A_flat = gen_random_polys(rng, 9)
+    A_hat = [A_flat[3 * i:3 * i + 3] for i in range(3)]
     s_noise = [cbd_sample_eta2(gen_cbd_bytes(rng)) for _ in range(3)]
     e_noise = [cbd_sample_eta2(gen_cbd_bytes(rng)) for _ in range(3)]
     t_hat, s_hat = keygen_inner(A_hat, s_noise, e_noise)
@@ -137,6 +142,11 @@ def gen_keygen_encaps_data(rng):
     return s_hat, u_compressed, v_compressed, m_bits, m_prime_oracle
 
 
+def build_fixture(seed):
+    """Oracle keygen + encaps + decrypt dataset (gen_keygen_encaps_data 5-tuple) for a seed."""
+    return gen_keygen_encaps_data(random.Random(seed))
+
+
 async def preload_decrypt_inputs(dut, s_hat, u_compressed, v_compressed):
     """Preload compressed ciphertext and secret key into bank slots."""
     # u[0..2] → slots 0-2
@@ -173,8 +183,7 @@ async def test_decrypt_basic(dut):
     """Load oracle-generated compressed ciphertext + s_hat, verify m' matches oracle."""
     await init(dut)
 
-    rng = random.Random(7000)
-    s_hat, u_comp, v_comp, m_bits, m_prime_oracle = gen_keygen_encaps_data(rng)
+    s_hat, u_comp, v_comp, m_bits, m_prime_oracle = build_fixture(7000)
 
     await preload_decrypt_inputs(dut, s_hat, u_comp, v_comp)
     await run_decrypt(dut)
@@ -192,8 +201,7 @@ async def test_decrypt_roundtrip(dut):
     """Full oracle keygen → oracle encaps → hardware decrypt, verify m' == original."""
     await init(dut)
 
-    rng = random.Random(7001)
-    s_hat, u_comp, v_comp, m_bits, m_prime_oracle = gen_keygen_encaps_data(rng)
+    s_hat, u_comp, v_comp, m_bits, m_prime_oracle = build_fixture(7001)
 
     await preload_decrypt_inputs(dut, s_hat, u_comp, v_comp)
     await run_decrypt(dut)
@@ -222,7 +230,8 @@ async def test_decrypt_zero_message(dut):
     rng = random.Random(7002)
 
     # Generate keygen data
-    A_hat = [[gen_random_poly(rng) for j in range(3)] for i in range(3)]
+    A_flat = gen_random_polys(rng, 9)
+    A_hat = [A_flat[3 * i:3 * i + 3] for i in range(3)]
     s_noise = [cbd_sample_eta2(gen_cbd_bytes(rng)) for _ in range(3)]
     e_noise = [cbd_sample_eta2(gen_cbd_bytes(rng)) for _ in range(3)]
     t_hat, s_hat = keygen_inner(A_hat, s_noise, e_noise)
@@ -262,8 +271,7 @@ async def test_decrypt_two_runs(dut):
     await init(dut)
 
     # First run
-    rng1 = random.Random(7003)
-    s_hat1, u_comp1, v_comp1, m_bits1, m_prime1 = gen_keygen_encaps_data(rng1)
+    s_hat1, u_comp1, v_comp1, m_bits1, m_prime1 = build_fixture(7003)
     await preload_decrypt_inputs(dut, s_hat1, u_comp1, v_comp1)
     await run_decrypt(dut)
     m1_hw = await read_poly(dut, 4)
@@ -272,8 +280,7 @@ async def test_decrypt_two_runs(dut):
     assert errors == 0, f"First decrypt: {errors} mismatches"
 
     # Second run
-    rng2 = random.Random(7004)
-    s_hat2, u_comp2, v_comp2, m_bits2, m_prime2 = gen_keygen_encaps_data(rng2)
+    s_hat2, u_comp2, v_comp2, m_bits2, m_prime2 = build_fixture(7004)
     await preload_decrypt_inputs(dut, s_hat2, u_comp2, v_comp2)
     await run_decrypt(dut)
     m2_hw = await read_poly(dut, 4)
@@ -289,14 +296,13 @@ async def test_decrypt_idle_after_done(dut):
     """Verify host I/O works after decrypt completes."""
     await init(dut)
 
-    rng = random.Random(7005)
-    s_hat, u_comp, v_comp, m_bits, m_prime = gen_keygen_encaps_data(rng)
+    s_hat, u_comp, v_comp, m_bits, m_prime = build_fixture(7005)
 
     await preload_decrypt_inputs(dut, s_hat, u_comp, v_comp)
     await run_decrypt(dut)
 
     # Write a known polynomial to a free slot and read it back
-    test_poly = gen_random_poly(rng)
+    test_poly = gen_random_poly(random.Random(7006))
     await write_poly(dut, 15, test_poly)
     result = await read_poly(dut, 15)
 
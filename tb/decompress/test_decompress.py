@@ -25,23 +25,36 @@ RESULT_SIGNALS = {
     11: 'result_d11',
 }
 
+# Expected outputs for every input, indexed by y (y spans range(2**d) densely)
+DECOMP_TABLES = {
+    d: tuple(decompress_q(y, d) for y in range(1 << d)) for d in D_VALUES
+}
+
+
+def signals(dut, d):
+    """Return the (y input, result output) handles for the given D.
+
+    Looked up once per test so the per-vector loop skips handle resolution.
+    """
+    return dut.y, getattr(dut, RESULT_SIGNALS[d])
+
 
-async def drive_and_check(dut, y, d):
-    """Drive y input, wait for combinational settle, check result for given D."""
-    dut.y.value = y
-    await Timer(1, unit='ns')
-    sig = getattr(dut, RESULT_SIGNALS[d])
-    result = sig.value.to_unsigned()
-    expected = decompress_q(y, d)
+async def drive_and_check(y_sig, result_sig, y, d):
+    """Drive y input, wait one simulation step, check result for given D."""
+    y_sig.value = y
+    await Timer(1, unit='step')
+    result = result_sig.value.to_unsigned()
+    expected = DECOMP_TABLES[d][y]
     return result, expected, result == expected
 
 
 @cocotb.test()
 async def test_exhaustive_d1(dut):
     """Exhaustive test for D=1: 2 values."""
+    y_sig, result_sig = signals(dut, 1)
     errors = 0
     for y in range(2):
-        result, expected, match = await drive_and_check(dut, y, 1)
+        result, expected, match = await drive_and_check(y_sig, result_sig, y, 1)
         if not match:
             dut._log.error(f"FAIL D=1: decompress({y}) = {result}, expected {expected}")
             errors += 1
@@ -53,9 +66,10 @@ async def test_exhaustive_d1(dut):
 @cocotb.test()
 async def test_exhaustive_d4(dut):
     """Exhaustive test for D=4: 16 values."""
+    y_sig, result_sig = signals(dut, 4)
     errors = 0
     for y in range(16):
-        result, expected, match = await drive_and_check(dut, y, 4)
+        result, expected, match = await drive_and_check(y_sig, result_sig, y, 4)
         if not match:
             dut._log.error(f"FAIL D=4: decompress({y}) = {result}, expected {expected}")
             errors += 1
@@ -67,9 +81,10 @@ async def test_exhaustive_d4(dut):
 @cocotb.test()
 async def test_exhaustive_d5(dut):
     """Exhaustive test for D=5: 32 values."""
+    y_sig, result_sig = signals(dut, 5)
     errors = 0
     for y in range(32):
-        result, expected, match = await drive_and_check(dut, y, 5)
+        result, expected, match = await drive_and_check(y_sig, result_sig, y, 5)
         if not match:
             dut._log.error(f"FAIL D=5: decompress({y}) = {result}, expected {expected}")
             errors += 1
@@ -81,9 +96,10 @@ async def test_exhaustive_d5(dut):
 @cocotb.test()
 async def test_exhaustive_d10(dut):
     """Exhaustive test for D=10: 1024 values."""
+    y_sig, result_sig = signals(dut, 10)
     errors = 0
     for y in range(1024):
-        result, expected, match = await drive_and_check(dut, y, 10)
+        result, expected, match = await drive_and_check(y_sig, result_sig, y, 10)
         if not match:
             dut._log.error(f"FAIL D=10: decompress({y}) = {result}, expected {expected}")
             errors += 1
@@ -95,9 +111,10 @@ async def test_exhaustive_d10(dut):
 @cocotb.test()
 async def test_exhaustive_d11(dut):
     """Exhaustive test for D=11: 2048 values."""
+    y_sig, result_sig = signals(dut, 11)
     errors = 0
     for y in range(2048):
-        result, expected, match = await drive_and_check(dut, y, 11)
+        result, expected, match = await drive_and_check(y_sig, result_sig, y, 11)
         if not match:
             dut._log.error(f"FAIL D=11: decompress({y}) = {result}, expected {expected}")
             errors += 1
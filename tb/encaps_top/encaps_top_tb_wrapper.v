@@ -0,0 +1,47 @@
+// encaps_top_tb_wrapper — encaps_top with an HDL-side clock generator
+//
+// Generates the 10 ns testbench clock in Verilog so it runs for the whole
+// simulation instead of being restarted by every cocotb test. clk stays
+// visible as an internal signal for the testbench's edge triggers.
+
+module encaps_top_tb_wrapper (
+    input  wire        rst_n,
+
+    // Host polynomial I/O (active when encaps is idle)
+    input  wire        host_we,
+    input  wire [4:0]  host_slot,
+    input  wire [7:0]  host_addr,
+    input  wire [11:0] host_din,
+    output wire [11:0] host_dout,
+
+    // Encaps control
+    input  wire        encaps_start,
+    output wire        encaps_done,
+    output wire        encaps_busy,
+
+    // CBD byte stream
+    input  wire        cbd_byte_valid,
+    input  wire [7:0]  cbd_byte_data,
+    output wire        cbd_byte_ready
+);
+
+    reg clk = 1'b0;
+    always #5 clk = ~clk;
+
+    encaps_top u_dut (
+        .clk            (clk),
+        .rst_n          (rst_n),
+        .host_we        (host_we),
+        .host_slot      (host_slot),
+        .host_addr      (host_addr),
+        .host_din       (host_din),
+        .host_dout      (host_dout),
+        .encaps_start   (encaps_start),
+        .encaps_done    (encaps_done),
+        .encaps_busy    (encaps_busy),
+        .cbd_byte_valid (cbd_byte_valid),
+        .cbd_byte_data  (cbd_byte_data),
+        .cbd_byte_ready (cbd_byte_ready)
+    );
+
+endmodule
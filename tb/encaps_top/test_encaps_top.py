@@ -18,8 +18,8 @@ import os
 import random
 
 import cocotb
-from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, ReadOnly, SimTimeoutError, with_timeout
+from cocotb.utils import get_sim_time
 
 # Add ref/ to path for oracle functions
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
@@ -28,15 +28,14 @@ from kyber_math import (
     ntt_forward, ntt_inverse,
     poly_basemul as oracle_basemul,
     poly_add as oracle_add,
-    compress_q, cbd_sample_eta2, encaps_inner,
+    poly_compress, cbd_sample_eta2, encaps_inner,
 )
 
-CLK_PERIOD_NS = 10
+CLK_PERIOD_NS = 10  # Must match the wrapper's always #5 clock
 
 
 async def init(dut):
-    """Start clock, assert reset, release."""
-    cocotb.start_soon(Clock(dut.clk, CLK_PERIOD_NS, unit='ns').start())
+    """Assert reset, release. The clock is generated by the HDL wrapper."""
     dut.rst_n.value = 0
     dut.host_we.value = 0
     dut.host_slot.value = 0
@@ -51,32 +50,43 @@ async def init(dut):
     await RisingEdge(dut.clk)
 
 
-async def write_poly(dut, slot, coeffs):
-    """Write 256 coefficients to a slot via host interface."""
-    for addr in range(KYBER_N):
-        dut.host_we.value = 1
+async def write_polys(dut, writes):
+    """Burst-write (slot, coeffs) pairs via host interface, one beat per cycle."""
+    host_addr, host_din, clk = dut.host_addr, dut.host_din, dut.clk
+    dut.host_we.value = 1
+    for slot, coeffs in writes:
         dut.host_slot.value = slot
-        dut.host_addr.value = addr
-        dut.host_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
+        for addr in range(KYBER_N):
+            host_addr.value = addr
+            host_din.value = coeffs[addr]
+            await RisingEdge(clk)
     dut.host_we.value = 0
-    await RisingEdge(dut.clk)
+
+
+async def write_poly(dut, slot, coeffs):
+    """Write 256 coefficients to a slot via host interface."""
+    await write_polys(dut, [(slot, coeffs)])
 
 
 async def read_poly(dut, slot):
-    """Read 256 coefficients from a slot (synchronous RAM: sample on FallingEdge)."""
+    """Read 256 coefficients from a slot, streaming one address per cycle."""
+    host_addr, host_dout, clk = dut.host_addr, dut.host_dout, dut.clk
+    dut.host_slot.value = slot
+    host_addr.value = 0
+    await RisingEdge(clk)
     result = []
-    for addr in range(KYBER_N):
-        dut.host_slot.value = slot
-        dut.host_addr.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result.append(dut.host_dout.value.to_unsigned())
+    for addr in range(1, KYBER_N + 1):
+        await FallingEdge(clk)
+        result.append(host_dout.value.to_unsigned())
+        if addr < KYBER_N:
+            host_addr.value = addr
     return result
 
 
 def compare_polys(got, expected, label, log, max_errors=10):
     """Compare two polynomials, return error count."""
+    if list(got) == list(expected):
+        return 0
     errors = 0
     for i in range(KYBER_N):
         if got[i] != expected[i]:
@@ -90,35 +100,42 @@ def compare_polys(got, expected, label, log, max_errors=10):
 
 def gen_random_poly(rng):
     """Generate a random polynomial in [0, q-1]."""
-    return [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    return gen_random_polys(rng, 1)[0]
 
 
-def gen_cbd_bytes(rng):
-    """Generate 128 random bytes for CBD sampling."""
-    return [rng.randint(0, 255) for _ in range(128)]
+def gen_random_polys(rng, count):
+    """Generate count random polynomials in [0, q-1] from one bulk RNG draw."""
+    flat = rng.choices(range(KYBER_Q), k=count * KYBER_N)
+    return [flat[i * KYBER_N:(i + 1) * KYBER_N] for i in range(count)]
 
 
 async def feed_cbd_bytes_background(dut, all_cbd_bytes, log):
     """Background coroutine: feed CBD bytes via valid/ready handshake.
 
-    all_cbd_bytes: flat list of all bytes to feed (7 × 128 = 896 bytes).
-    Feeds one byte per cycle when ready is asserted.
+    all_cbd_bytes: bytes to feed, in sampler order (7 × 128 = 896 bytes).
     """
     byte_idx = 0
     total = len(all_cbd_bytes)
+    dut.cbd_byte_valid.value = 1
     while byte_idx < total:
-        dut.cbd_byte_valid.value = 1
         dut.cbd_byte_data.value = all_cbd_bytes[byte_idx]
-        await FallingEdge(dut.clk)
+        await ReadOnly()
         if dut.cbd_byte_ready.value == 1:
             byte_idx += 1
-        await RisingEdge(dut.clk)
+            await RisingEdge(dut.clk)
+        else:
+            await RisingEdge(dut.cbd_byte_ready)
     dut.cbd_byte_valid.value = 0
     log.info(f"CBD feeder: all {total} bytes delivered")
 
 
 async def run_encaps(dut, all_cbd_bytes, timeout=200000):
-    """Start encapsulation and wait for done, feeding CBD bytes in background."""
+    """Start encapsulation and wait for done, feeding CBD bytes in background.
+
+    Waits on the rising edge of the encaps_done pulse under a sim-time
+    timeout instead of polling it every cycle, and derives the cycle count
+    from sim time.
+    """
     # Start CBD byte feeder
     feeder = cocotb.start_soon(
         feed_cbd_bytes_background(dut, all_cbd_bytes, dut._log)
@@ -128,15 +145,17 @@ async def run_encaps(dut, all_cbd_bytes, timeout=200000):
     dut.encaps_start.value = 1
     await RisingEdge(dut.clk)
     dut.encaps_start.value = 0
+    start_ns = get_sim_time(unit='ns')
+
+    try:
+        await with_timeout(RisingEdge(dut.encaps_done), timeout * CLK_PERIOD_NS, 'ns')
+    except SimTimeoutError:
+        feeder.cancel()
+        raise TimeoutError(f"Encaps did not complete within {timeout} cycles")
 
-    # Wait for encaps_done
-    for cycle in range(timeout):
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        if dut.encaps_done.value == 1:
-            dut._log.info(f"Encaps completed in ~{cycle + 1} cycles")
-            return cycle + 1
-    raise TimeoutError(f"Encaps did not complete within {timeout} cycles")
+    cycles = round((get_sim_time(unit='ns') - start_ns) / CLK_PERIOD_NS)
+    dut._log.info(f"Encaps completed in ~{cycles} cycles")
+    return cycles
 
 
 def setup_encaps_inputs(rng):
@@ -146,25 +165,21 @@ def setup_encaps_inputs(rng):
         A_hat: 3x3 list of NTT-domain polys
         t_hat: list of 3 NTT-domain polys
         m: decompressed message poly
-        cbd_bytes_list: list of 7 lists of 128 bytes each
-        all_cbd_bytes: flat list of 896 bytes
+        cbd_bytes_list: list of 7 bytes objects of 128 bytes each
+        all_cbd_bytes: bytes object of 896 bytes
         r, e1, e2: sampled noise polys (from oracle)
     """
-    # Generate A_hat[j][i] — 9 NTT-domain polys
-    A_hat = [[gen_random_poly(rng) for i in range(3)] for j in range(3)]
-
-    # Generate t_hat[0..2] — 3 NTT-domain polys
-    t_hat = [gen_random_poly(rng) for _ in range(3)]
-
-    # Message polynomial (as if decompressed from 32 bytes)
-    m = gen_random_poly(rng)
+    # A_hat[j][i] (9 NTT-domain polys), t_hat[0..2] (3 NTT-domain polys) and
+    # the message polynomial (as if decompressed from 32 bytes) in one draw
+    polys = gen_random_polys(rng, 13)
+    A_hat = [polys[3 * j:3 * j + 3] for j in range(3)]
+    t_hat = polys[9:12]
+    m = polys[12]
 
     # CBD bytes: 7 × 128 bytes = 896 bytes total
     # Order: r[0], r[1], r[2], e1[0], e1[1], e1[2], e2
-    cbd_bytes_list = [gen_cbd_bytes(rng) for _ in range(7)]
-    all_cbd_bytes = []
-    for b in cbd_bytes_list:
-        all_cbd_bytes.extend(b)
+    all_cbd_bytes = rng.randbytes(7 * 128)
+    cbd_bytes_list = [all_cbd_bytes[i * 128:(i + 1) * 128] for i in range(7)]
 
     # Compute oracle noise polynomials
     r = [cbd_sample_eta2(cbd_bytes_list[i]) for i in range(3)]
@@ -174,19 +189,33 @@ def setup_encaps_inputs(rng):
     return A_hat, t_hat, m, cbd_bytes_list, all_cbd_bytes, r, e1, e2
 
 
+def get_oracle(seed):
+    """Encaps inputs and oracle results for a seed.
+
+    Returns:
+        (A_hat, t_hat, m, all_cbd_bytes, u_oracle, v_oracle, r_hat_oracle,
+         u_compressed, v_compressed), where u_compressed uses D=10 and
+        v_compressed uses D=4.
+    """
+    A_hat, t_hat, m, _, all_cbd_bytes, r, e1, e2 = setup_encaps_inputs(random.Random(seed))
+    # NTT(r) once: it is both an oracle for slots 13-15 and an encaps input
+    r_hat_oracle = [ntt_forward(r[i]) for i in range(3)]
+    u_oracle, v_oracle = encaps_inner(A_hat, t_hat, r, e1, e2, m, r_hat=r_hat_oracle)
+    u_compressed = [poly_compress(u_oracle[i], 10) for i in range(3)]
+    v_compressed = poly_compress(v_oracle, 4)
+    return (A_hat, t_hat, m, all_cbd_bytes, u_oracle, v_oracle, r_hat_oracle,
+            u_compressed, v_compressed)
+
+
 async def preload_inputs(dut, A_hat, t_hat, m):
-    """Preload A_hat, t_hat, and m into the bank slots."""
+    """Preload A_hat, t_hat, and m into the bank slots in one write burst."""
     # A_hat[j][i] → slot j*3+i
-    for j in range(3):
-        for i in range(3):
-            await write_poly(dut, j * 3 + i, A_hat[j][i])
-
+    writes = [(j * 3 + i, A_hat[j][i]) for j in range(3) for i in range(3)]
     # t_hat[0..2] → slots 9-11
-    for k in range(3):
-        await write_poly(dut, 9 + k, t_hat[k])
-
+    writes += [(9 + k, t_hat[k]) for k in range(3)]
     # m → slot 12
-    await write_poly(dut, 12, m)
+    writes.append((12, m))
+    await write_polys(dut, writes)
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -194,105 +223,60 @@ async def preload_inputs(dut, A_hat, t_hat, m):
 # ═══════════════════════════════════════════════════════════════════
 
 @cocotb.test()
-async def test_encaps_basic(dut):
-    """Full encapsulation: verify u[0..2] and v against oracle."""
-    await init(dut)
+async def test_encaps_full_verify(dut):
+    """Single encaps run, checking every output and preserved slot.
 
-    rng = random.Random(5000)
-    A_hat, t_hat, m, _, all_cbd_bytes, r, e1, e2 = setup_encaps_inputs(rng)
-
-    # Preload inputs
-    await preload_inputs(dut, A_hat, t_hat, m)
-
-    # Run encapsulation
-    await run_encaps(dut, all_cbd_bytes)
-
-    # Compute oracle results
-    u_oracle, v_oracle = encaps_inner(A_hat, t_hat, r, e1, e2, m)
-
-    # Verify uncompressed u[0..2] in slots 0-2
-    total_errors = 0
-    for i in range(3):
-        result = await read_poly(dut, i)
-        errors = compare_polys(result, u_oracle[i], f"u[{i}] (slot {i})", dut._log)
-        total_errors += errors
-
-    # Verify uncompressed v in slot 9
-    result_v = await read_poly(dut, 9)
-    errors = compare_polys(result_v, v_oracle, "v (slot 9)", dut._log)
-    total_errors += errors
-
-    assert total_errors == 0, f"Encaps basic: {total_errors} total mismatches"
-    dut._log.info("PASS: Encaps basic — u[0..2] and v match oracle")
-
-
-@cocotb.test()
-async def test_encaps_compress_values(dut):
-    """Verify compressed output slots match compress_q(oracle, D)."""
+    Verifies u[0..2] (slots 0-2) and v (slot 9) against the oracle, the
+    compressed outputs (slots 16-18 with D=10, slot 19 with D=4), that r_hat
+    (slots 13-15) and the message (slot 12) survive the matmul phases, and
+    that host I/O still works once encaps is done.
+    """
     await init(dut)
 
-    rng = random.Random(5001)
-    A_hat, t_hat, m, _, all_cbd_bytes, r, e1, e2 = setup_encaps_inputs(rng)
+    (A_hat, t_hat, m, all_cbd_bytes, u_oracle, v_oracle, r_hat_oracle,
+     u_comp, v_comp) = get_oracle(5000)
 
     await preload_inputs(dut, A_hat, t_hat, m)
     await run_encaps(dut, all_cbd_bytes)
 
-    u_oracle, v_oracle = encaps_inner(A_hat, t_hat, r, e1, e2, m)
+    # (slot, expected, label) for every slot with a known post-encaps value
+    checks = [(i, u_oracle[i], f"u[{i}] (slot {i})") for i in range(3)]
+    checks.append((9, v_oracle, "v (slot 9)"))
+    # Slot 12 (message) is only read during Phase 3, never written
+    checks.append((12, m, "message (slot 12)"))
+    # r_hat = NTT(r) is read-only through Phases 2-3
+    checks += [(13 + i, r_hat_oracle[i], f"r_hat[{i}] (slot {13+i})") for i in range(3)]
+    checks += [(16 + i, u_comp[i], f"compress_u[{i}] (slot {16+i})") for i in range(3)]
+    checks.append((19, v_comp, "compress_v (slot 19)"))
 
-    # Verify compressed u[0..2] in slots 16-18 (D=10)
     total_errors = 0
-    for i in range(3):
-        result = await read_poly(dut, 16 + i)
-        expected = [compress_q(c, 10) for c in u_oracle[i]]
-        errors = compare_polys(result, expected, f"compress_u[{i}] (slot {16+i})", dut._log)
-        total_errors += errors
+    for slot, expected, label in checks:
+        result = await read_poly(dut, slot)
+        total_errors += compare_polys(result, expected, label, dut._log)
+    assert total_errors == 0, f"Encaps full verify: {total_errors} total mismatches"
 
-    # Verify compressed v in slot 19 (D=4)
-    result_v = await read_poly(dut, 19)
-    expected_v = [compress_q(c, 4) for c in v_oracle]
-    errors = compare_polys(result_v, expected_v, "compress_v (slot 19)", dut._log)
-    total_errors += errors
-
-    assert total_errors == 0, f"Encaps compress: {total_errors} total mismatches"
-    dut._log.info("PASS: Encaps compress values verified against oracle")
-
-
-@cocotb.test()
-async def test_encaps_slot_preservation(dut):
-    """Verify r_hat (slots 13-15) survive through Phases 2-3 (read-only)."""
-    await init(dut)
-
-    rng = random.Random(5002)
-    A_hat, t_hat, m, _, all_cbd_bytes, r, e1, e2 = setup_encaps_inputs(rng)
-
-    await preload_inputs(dut, A_hat, t_hat, m)
-    await run_encaps(dut, all_cbd_bytes)
-
-    # r_hat = NTT(r) — computed by oracle
-    r_hat_oracle = [ntt_forward(r[i]) for i in range(3)]
-
-    total_errors = 0
-    for i in range(3):
-        result = await read_poly(dut, 13 + i)
-        errors = compare_polys(result, r_hat_oracle[i], f"r_hat[{i}] (slot {13+i})", dut._log)
-        total_errors += errors
+    # Write a known polynomial to a free slot and read it back
+    test_poly = gen_random_poly(random.Random(5007))
+    await write_poly(dut, 3, test_poly)  # slot 3 was consumed by Phase 2
+    result = await read_poly(dut, 3)
 
-    assert total_errors == 0, f"Slot preservation: {total_errors} mismatches"
-    dut._log.info("PASS: r_hat slots 13-15 preserved through matmul phases")
+    errors = compare_polys(result, test_poly, "idle_after_done", dut._log)
+    assert errors == 0, f"Host I/O after encaps: {errors} mismatches"
+    dut._log.info("PASS: Encaps full verify — outputs, preserved slots, and host I/O")
 
 
 @cocotb.test()
 async def test_encaps_two_runs(dut):
     """Run encaps twice with different randomness, verify different outputs."""
+    # Both oracles up front, so no Python oracle work sits between the runs
+    A_hat1, t_hat1, m1, cbd1, u1_oracle, v1_oracle, _, _, _ = get_oracle(5003)
+    A_hat2, t_hat2, m2, cbd2, u2_oracle, v2_oracle, _, _, _ = get_oracle(5004)
+
     await init(dut)
 
     # First run
-    rng1 = random.Random(5003)
-    A_hat1, t_hat1, m1, _, cbd1, r1, e11, e21 = setup_encaps_inputs(rng1)
     await preload_inputs(dut, A_hat1, t_hat1, m1)
     await run_encaps(dut, cbd1)
-
-    u1_oracle, v1_oracle = encaps_inner(A_hat1, t_hat1, r1, e11, e21, m1)
     u1_hw = []
     for i in range(3):
         u1_hw.append(await read_poly(dut, i))
@@ -306,12 +290,8 @@ async def test_encaps_two_runs(dut):
     assert total_errors == 0, f"First run: {total_errors} mismatches"
 
     # Second run with different inputs
-    rng2 = random.Random(5004)
-    A_hat2, t_hat2, m2, _, cbd2, r2, e12, e22 = setup_encaps_inputs(rng2)
     await preload_inputs(dut, A_hat2, t_hat2, m2)
     await run_encaps(dut, cbd2)
-
-    u2_oracle, v2_oracle = encaps_inner(A_hat2, t_hat2, r2, e12, e22, m2)
     u2_hw = []
     for i in range(3):
         u2_hw.append(await read_poly(dut, i))
@@ -329,42 +309,3 @@ async def test_encaps_two_runs(dut):
     assert same_count < KYBER_N, "Two runs with different inputs produced identical u[0]"
 
     dut._log.info("PASS: Two encaps runs with different inputs both verified")
-
-
-@cocotb.test()
-async def test_encaps_idle_after_done(dut):
-    """Verify host I/O works after encaps completes."""
-    await init(dut)
-
-    rng = random.Random(5005)
-    A_hat, t_hat, m, _, all_cbd_bytes, r, e1, e2 = setup_encaps_inputs(rng)
-
-    await preload_inputs(dut, A_hat, t_hat, m)
-    await run_encaps(dut, all_cbd_bytes)
-
-    # Write a known polynomial to a free slot and read it back
-    test_poly = gen_random_poly(rng)
-    await write_poly(dut, 3, test_poly)  # slot 3 was consumed by Phase 2
-    result = await read_poly(dut, 3)
-
-    errors = compare_polys(result, test_poly, "idle_after_done", dut._log)
-    assert errors == 0, f"Host I/O after encaps: {errors} mismatches"
-    dut._log.info("PASS: Host I/O works after encaps completes")
-
-
-@cocotb.test()
-async def test_encaps_message_slot(dut):
-    """Verify message slot 12 is not corrupted during encaps."""
-    await init(dut)
-
-    rng = random.Random(5006)
-    A_hat, t_hat, m, _, all_cbd_bytes, r, e1, e2 = setup_encaps_inputs(rng)
-
-    await preload_inputs(dut, A_hat, t_hat, m)
-    await run_encaps(dut, all_cbd_bytes)
-
-    # Slot 12 (message) is only read during Phase 3, never written
-    result_m = await read_poly(dut, 12)
-    errors = compare_polys(result_m, m, "message (slot 12)", dut._log)
-    assert errors == 0, f"Message slot: {errors} mismatches"
-    dut._log.info("PASS: Message slot 12 preserved through encaps")
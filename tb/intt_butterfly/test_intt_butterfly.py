@@ -19,15 +19,19 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
 from kyber_math import KYBER_Q, intt_butterfly
 
 
-async def drive_and_check(dut, even, odd, zeta):
-    """Drive inputs, wait, return (even_out, odd_out, exp_even, exp_odd, match)."""
-    exp_even, exp_odd = intt_butterfly(even, odd, zeta)
+async def drive(dut, even, odd, zeta):
+    """Drive inputs, wait one simulation step, return (even_out, odd_out)."""
     dut.even.value = even
     dut.odd.value = odd
     dut.zeta.value = zeta
-    await Timer(1, unit='ns')
-    result_even = dut.even_out.value.to_unsigned()
-    result_odd = dut.odd_out.value.to_unsigned()
+    await Timer(1, unit='step')
+    return dut.even_out.value.to_unsigned(), dut.odd_out.value.to_unsigned()
+
+
+async def drive_and_check(dut, even, odd, zeta):
+    """Drive inputs, wait, return (even_out, odd_out, exp_even, exp_odd, match)."""
+    exp_even, exp_odd = intt_butterfly(even, odd, zeta)
+    result_even, result_odd = await drive(dut, even, odd, zeta)
     match = (result_even == exp_even) and (result_odd == exp_odd)
     return result_even, result_odd, exp_even, exp_odd, match
 
@@ -117,17 +121,31 @@ async def test_algebraic_properties(dut):
 
 @cocotb.test()
 async def test_random_triples(dut):
-    """100k random (even, odd, zeta) triples."""
+    """10k random (even, odd, zeta) triples plus a power-of-two zeta sweep.
+
+    Every zeta = 2^k (k = 0..11) is paired with extreme and random (even, odd)
+    values, so each bit of the multiplier's zeta operand is exercised alone.
+    """
     rng = random.Random(42)
-    n_samples = 100_000
     errors = 0
 
-    for _ in range(n_samples):
-        even = rng.randint(0, KYBER_Q - 1)
-        odd = rng.randint(0, KYBER_Q - 1)
-        zeta = rng.randint(0, KYBER_Q - 1)
-        re, ro, ee, eo, match = await drive_and_check(dut, even, odd, zeta)
-        if not match:
+    triples = [
+        (rng.randint(0, KYBER_Q - 1), rng.randint(0, KYBER_Q - 1), rng.randint(0, KYBER_Q - 1))
+        for _ in range(10_000)
+    ]
+    extremes = [0, 1, KYBER_Q // 2, KYBER_Q - 2, KYBER_Q - 1]
+    for zeta in (1 << k for k in range(12)):
+        triples += [(even, odd, zeta) for even in extremes for odd in extremes]
+        triples += [
+            (rng.randint(0, KYBER_Q - 1), rng.randint(0, KYBER_Q - 1), zeta)
+            for _ in range(64)
+        ]
+    n_samples = len(triples)
+    expected = list(map(intt_butterfly, *zip(*triples)))
+
+    for (even, odd, zeta), (ee, eo) in zip(triples, expected):
+        re, ro = await drive(dut, even, odd, zeta)
+        if re != ee or ro != eo:
             dut._log.error(
                 f"FAIL: intt_bf({even}, {odd}, {zeta}) = ({re}, {ro}), "
                 f"expected ({ee}, {eo})"
@@ -135,4 +153,4 @@ async def test_random_triples(dut):
             errors += 1
 
     assert errors == 0, f"Random test: {errors} errors out of {n_samples}"
-    dut._log.info(f"PASS: {n_samples} random triples verified")
+    dut._log.info(f"PASS: {n_samples} random and zeta-sweep triples verified")
@@ -6,7 +6,6 @@ Tests SHA3-256, SHA3-512, SHAKE-128, SHAKE-256 against Python hashlib oracle.
 """
 
 import cocotb
-from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, FallingEdge, ClockCycles
 import hashlib
 
@@ -18,7 +17,10 @@ SHAKE_256 = 3
 
 
 async def reset_dut(dut):
-    """Reset the DUT and initialize all inputs."""
+    """Reset the DUT and initialize all inputs.
+
+    The clock is generated by the HDL wrapper.
+    """
     dut.rst_n.value = 0
     dut.start.value = 0
     dut.mode.value = 0
@@ -48,19 +50,20 @@ async def absorb_message(dut, data):
         dut.absorb_last.value = 0
         return
 
+    # absorb_ready is decoded from the registered FSM state, so the value seen
+    # at a FallingEdge holds through the following RisingEdge. Sampling it and
+    # driving the next byte on the same FallingEdge costs one await per
+    # accepted byte; only stalled cycles go around the inner loop again.
+    await FallingEdge(dut.clk)
     for i, byte_val in enumerate(data):
-        is_last = (i == len(data) - 1)
         dut.absorb_valid.value = 1
         dut.absorb_data.value = byte_val
-        dut.absorb_last.value = int(is_last)
-
-        # Wait for absorb_ready at FallingEdge, then transfer on next RisingEdge
+        dut.absorb_last.value = int(i == len(data) - 1)
         while True:
+            ready = dut.absorb_ready.value == 1
             await FallingEdge(dut.clk)
-            if dut.absorb_ready.value == 1:
-                await RisingEdge(dut.clk)
+            if ready:
                 break
-            await RisingEdge(dut.clk)
 
     dut.absorb_valid.value = 0
     dut.absorb_last.value = 0
@@ -68,17 +71,21 @@ async def absorb_message(dut, data):
 
 async def squeeze_bytes(dut, n):
     """Read n output bytes from the sponge via valid/ready handshake."""
-    result = []
+    result = bytearray(n)
     dut.squeeze_ready.value = 1
 
-    for _ in range(n):
+    # Same FallingEdge-only handshake as absorb_message: squeeze_valid and
+    # squeeze_data are stable mid-cycle, and a byte seen there is consumed on
+    # the next RisingEdge.
+    await FallingEdge(dut.clk)
+    for i in range(n):
         while True:
+            valid = dut.squeeze_valid.value == 1
+            if valid:
+                result[i] = dut.squeeze_data.value.to_unsigned()
             await FallingEdge(dut.clk)
-            if dut.squeeze_valid.value == 1:
-                result.append(dut.squeeze_data.value.to_unsigned())
-                await RisingEdge(dut.clk)
+            if valid:
                 break
-            await RisingEdge(dut.clk)
 
     dut.squeeze_ready.value = 0
     return bytes(result)
@@ -107,8 +114,6 @@ def compare_result(name, got, expected):
 @cocotb.test()
 async def test_sha3_256_empty(dut):
     """SHA3-256 of empty message."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     result = await hash_message(dut, SHA3_256, b"", 32)
@@ -120,8 +125,6 @@ async def test_sha3_256_empty(dut):
 @cocotb.test()
 async def test_sha3_256_short(dut):
     """SHA3-256 of 'abc' — NIST FIPS 202 example."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     result = await hash_message(dut, SHA3_256, b"abc", 32)
@@ -133,8 +136,6 @@ async def test_sha3_256_short(dut):
 @cocotb.test()
 async def test_sha3_256_multiblock(dut):
     """SHA3-256 of message > 136 bytes (multi-block absorb)."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = bytes(range(256)) * 2  # 512 bytes
@@ -147,8 +148,6 @@ async def test_sha3_256_multiblock(dut):
 @cocotb.test()
 async def test_sha3_512_short(dut):
     """SHA3-512 of 'abc'."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     result = await hash_message(dut, SHA3_512, b"abc", 64)
@@ -160,8 +159,6 @@ async def test_sha3_512_short(dut):
 @cocotb.test()
 async def test_sha3_512_multiblock(dut):
     """SHA3-512 of message > 72 bytes (multi-block absorb)."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = bytes(range(256))  # 256 bytes, well over rate=72
@@ -174,8 +171,6 @@ async def test_sha3_512_multiblock(dut):
 @cocotb.test()
 async def test_shake128_short(dut):
     """SHAKE-128 of short message, squeeze 32 bytes."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = b"test message"
@@ -188,8 +183,6 @@ async def test_shake128_short(dut):
 @cocotb.test()
 async def test_shake128_long_squeeze(dut):
     """SHAKE-128 squeeze 256 bytes (multi-block squeeze)."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = b"long squeeze test"
@@ -202,8 +195,6 @@ async def test_shake128_long_squeeze(dut):
 @cocotb.test()
 async def test_shake256_short(dut):
     """SHAKE-256 of short message, squeeze 32 bytes."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     msg = b"shake256 test"
@@ -216,8 +207,6 @@ async def test_shake256_short(dut):
 @cocotb.test()
 async def test_shake256_prf(dut):
     """SHAKE-256 PRF pattern: key||nonce -> 128 bytes (ML-KEM PRF)."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # ML-KEM PRF: key (32 bytes) || nonce (1 byte) -> 128 bytes
@@ -234,8 +223,6 @@ async def test_shake256_prf(dut):
 @cocotb.test()
 async def test_block_boundary_pad(dut):
     """Message exactly fills rate block (padding goes into next block)."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # SHA3-256 rate = 136. Message of exactly 136 bytes fills one block.
@@ -250,8 +237,6 @@ async def test_block_boundary_pad(dut):
 @cocotb.test()
 async def test_back_to_back(dut):
     """Two consecutive hashes using start reset."""
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
     await reset_dut(dut)
 
     # First hash: SHA3-256
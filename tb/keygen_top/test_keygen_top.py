@@ -14,10 +14,13 @@ against Python oracle.
 import sys
 import os
 import random
+import itertools
+import operator
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, ReadOnly, SimTimeoutError, with_timeout
+from cocotb.utils import get_sim_time
 
 # Add ref/ to path for oracle functions
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
@@ -47,70 +50,115 @@ async def init(dut):
     await RisingEdge(dut.clk)
 
 
-async def write_poly(dut, slot, coeffs):
-    """Write 256 coefficients to a slot via host interface."""
-    for addr in range(KYBER_N):
-        dut.host_we.value = 1
+async def write_polys(dut, writes):
+    """Burst-write (slot, coeffs) pairs via host interface, one beat per cycle.
+
+    host_we stays high across slot boundaries and is dropped once at the end,
+    without an idle cycle: the last beat is already latched on its edge.
+
+    Coefficients are assigned as plain ints: for ports up to 32 bits cocotb
+    hands those straight to set_signal_val_int, whereas a pre-built
+    LogicArray would be re-serialized to a binary string on every write.
+    """
+    host_addr, host_din = dut.host_addr, dut.host_din
+    clk_rise = RisingEdge(dut.clk)
+    dut.host_we.value = 1
+    for slot, coeffs in writes:
         dut.host_slot.value = slot
-        dut.host_addr.value = addr
-        dut.host_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
+        for addr in range(KYBER_N):
+            host_addr.value = addr
+            host_din.value = coeffs[addr]
+            await clk_rise
     dut.host_we.value = 0
+
+
+async def write_poly(dut, slot, coeffs):
+    """Write 256 coefficients to a slot via host interface."""
+    await write_polys(dut, [(slot, coeffs)])
+
+
+async def read_polys(dut, slots):
+    """Read 256 coefficients from each slot in one back-to-back burst."""
+    host_slot, host_addr, host_dout = dut.host_slot, dut.host_addr, dut.host_dout
+    clk_fall = FallingEdge(dut.clk)
+    results = [[0] * KYBER_N for _ in slots]
+    host_slot.value = slots[0]
+    host_addr.value = 0
     await RisingEdge(dut.clk)
+    for n, result in enumerate(results):
+        for addr in range(1, KYBER_N + 1):
+            await clk_fall
+            result[addr - 1] = host_dout.value.to_unsigned()
+            if addr < KYBER_N:
+                host_addr.value = addr
+        if n + 1 < len(slots):
+            host_slot.value = slots[n + 1]
+            host_addr.value = 0
+    return results
 
 
 async def read_poly(dut, slot):
-    """Read 256 coefficients from a slot (synchronous RAM: sample on FallingEdge)."""
-    result = []
-    for addr in range(KYBER_N):
-        dut.host_slot.value = slot
-        dut.host_addr.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result.append(dut.host_dout.value.to_unsigned())
-    return result
+    """Read 256 coefficients from a slot via host interface."""
+    return (await read_polys(dut, [slot]))[0]
 
 
 def compare_polys(got, expected, label, log, max_errors=10):
     """Compare two polynomials, return error count."""
-    errors = 0
-    for i in range(KYBER_N):
-        if got[i] != expected[i]:
-            log.error(f"FAIL {label}: coeff[{i}] = {got[i]}, expected {expected[i]}")
-            errors += 1
-            if errors >= max_errors:
-                log.error("(stopping after max errors)")
-                break
+    if list(got) == list(expected):
+        return 0
+    errors = sum(map(operator.ne, got, expected))
+    mismatches = (i for i in range(KYBER_N) if got[i] != expected[i])
+    for i in itertools.islice(mismatches, max_errors):
+        log.error(f"FAIL {label}: coeff[{i}] = {got[i]}, expected {expected[i]}")
+    if errors > max_errors:
+        log.error(f"(stopping after max errors; {errors} mismatches total)")
     return errors
 
 
 def gen_random_poly(rng):
     """Generate a random polynomial in [0, q-1]."""
-    return [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    return gen_random_polys(rng, 1)[0]
 
 
-def gen_cbd_bytes(rng):
-    """Generate 128 random bytes for CBD sampling."""
-    return [rng.randint(0, 255) for _ in range(128)]
+def gen_random_polys(rng, count):
+    """Generate count random polynomials in [0, q-1] from one bulk RNG draw."""
+    flat = rng.choices(range(KYBER_Q), k=count * KYBER_N)
+    return [flat[i * KYBER_N:(i + 1) * KYBER_N] for i in range(count)]
 
 
 async def feed_cbd_bytes_background(dut, all_cbd_bytes, log):
-    """Background coroutine: feed CBD bytes via valid/ready handshake."""
+    """Background coroutine: feed CBD bytes via valid/ready handshake.
+
+    cbd_byte_valid is held high throughout; only the data changes. ready is
+    sampled in ReadOnly before each clock edge. While the sampler is not
+    ready, the coroutine sleeps on RisingEdge(cbd_byte_ready) instead of
+    polling every cycle. ready is registered, so it only rises just after a
+    clock edge, which keeps the next sample aligned.
+    """
+    byte_data, byte_ready = dut.cbd_byte_data, dut.cbd_byte_ready
+    clk_rise, ready_rise = RisingEdge(dut.clk), RisingEdge(byte_ready)
     byte_idx = 0
     total = len(all_cbd_bytes)
+    dut.cbd_byte_valid.value = 1
     while byte_idx < total:
-        dut.cbd_byte_valid.value = 1
-        dut.cbd_byte_data.value = all_cbd_bytes[byte_idx]
-        await FallingEdge(dut.clk)
-        if dut.cbd_byte_ready.value == 1:
+        byte_data.value = all_cbd_bytes[byte_idx]
+        await ReadOnly()
+        if byte_ready.value == 1:
             byte_idx += 1
-        await RisingEdge(dut.clk)
+            await clk_rise
+        else:
+            await ready_rise
     dut.cbd_byte_valid.value = 0
     log.info(f"CBD feeder: all {total} bytes delivered")
 
 
 async def run_keygen(dut, all_cbd_bytes, timeout=200000):
-    """Start keygen and wait for done, feeding CBD bytes in background."""
+    """Start keygen and wait for done, feeding CBD bytes in background.
+
+    Waits on the rising edge of the keygen_done pulse under a sim-time
+    timeout instead of polling it every cycle, and derives the cycle count
+    from sim time.
+    """
     feeder = cocotb.start_soon(
         feed_cbd_bytes_background(dut, all_cbd_bytes, dut._log)
     )
@@ -119,35 +167,38 @@ async def run_keygen(dut, all_cbd_bytes, timeout=200000):
     dut.keygen_start.value = 1
     await RisingEdge(dut.clk)
     dut.keygen_start.value = 0
+    start_ns = get_sim_time(unit='ns')
 
-    # Wait for keygen_done
-    for cycle in range(timeout):
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        if dut.keygen_done.value == 1:
-            dut._log.info(f"KeyGen completed in ~{cycle + 1} cycles")
-            return cycle + 1
-    raise TimeoutError(f"KeyGen did not complete within {timeout} cycles")
+    try:
+        await with_timeout(RisingEdge(dut.keygen_done), timeout * CLK_PERIOD_NS, 'ns')
+    except SimTimeoutError:
+        feeder.cancel()
+        raise TimeoutError(f"KeyGen did not complete within {timeout} cycles")
 
+    cycles = round((get_sim_time(unit='ns') - start_ns) / CLK_PERIOD_NS)
+    dut._log.info(f"KeyGen completed in ~{cycles} cycles")
+    return cycles
 
-def setup_keygen_inputs(rng):
-    """Generate all keygen inputs from a deterministic RNG.
+
+def setup_keygen_inputs(seed):
+    """Generate all keygen inputs from a deterministic seed.
 
     Returns:
         A_hat: 3x3 list of NTT-domain polys (A_hat[i][j] = row i, col j)
-        cbd_bytes_list: list of 6 lists of 128 bytes each
-        all_cbd_bytes: flat list of 768 bytes
+        cbd_bytes_list: list of 6 bytes objects of 128 bytes each
+        all_cbd_bytes: bytes object of 768 bytes
         s_noise, e_noise: sampled noise polys (from oracle)
     """
-    # Generate A_hat[i][j] — 9 NTT-domain polys (row-major)
-    A_hat = [[gen_random_poly(rng) for j in range(3)] for i in range(3)]
+    rng = random.Random(seed)
+
+    # Generate A_hat[i][j] — 9 NTT-domain polys (row-major), in one draw
+    A_flat = gen_random_polys(rng, 9)
+    A_hat = [A_flat[3 * i:3 * i + 3] for i in range(3)]
 
     # CBD bytes: 6 × 128 bytes = 768 bytes total
     # Order: s[0], s[1], s[2], e[0], e[1], e[2]
-    cbd_bytes_list = [gen_cbd_bytes(rng) for _ in range(6)]
-    all_cbd_bytes = []
-    for b in cbd_bytes_list:
-        all_cbd_bytes.extend(b)
+    all_cbd_bytes = rng.randbytes(6 * 128)
+    cbd_bytes_list = [all_cbd_bytes[i * 128:(i + 1) * 128] for i in range(6)]
 
     # Compute oracle noise polynomials
     s_noise = [cbd_sample_eta2(cbd_bytes_list[i]) for i in range(3)]
@@ -156,11 +207,24 @@ def setup_keygen_inputs(rng):
     return A_hat, cbd_bytes_list, all_cbd_bytes, s_noise, e_noise
 
 
+def get_oracle(seed):
+    """Keygen inputs and oracle results for a seed.
+
+    Returns:
+        (A_hat, all_cbd_bytes, t_hat_oracle, s_hat_oracle, e_hat_oracle).
+    """
+    A_hat, _, all_cbd_bytes, s_noise, e_noise = setup_keygen_inputs(seed)
+    # NTT(s) and NTT(e) once: oracles for slots 9-14 and keygen_inner inputs
+    s_hat_oracle = [ntt_forward(s_noise[i]) for i in range(3)]
+    e_hat_oracle = [ntt_forward(e_noise[i]) for i in range(3)]
+    t_hat_oracle, _ = keygen_inner(A_hat, s_noise, e_noise,
+                                   s_hat=s_hat_oracle, e_hat=e_hat_oracle)
+    return A_hat, all_cbd_bytes, t_hat_oracle, s_hat_oracle, e_hat_oracle
+
+
 async def preload_a_hat(dut, A_hat):
-    """Preload A_hat[i][j] into bank slots (row-major: slot = i*3+j)."""
-    for i in range(3):
-        for j in range(3):
-            await write_poly(dut, i * 3 + j, A_hat[i][j])
+    """Preload A_hat[i][j] into bank slots (row-major: slot = i*3+j) in one burst."""
+    await write_polys(dut, [(i * 3 + j, A_hat[i][j]) for i in range(3) for j in range(3)])
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -172,8 +236,8 @@ async def test_keygen_basic(dut):
     """Full keygen: verify t_hat (slots 0,3,6) and s_hat (slots 9-11) match oracle."""
     await init(dut)
 
-    rng = random.Random(6000)
-    A_hat, _, all_cbd_bytes, s_noise, e_noise = setup_keygen_inputs(rng)
+    # Oracle results up front, ahead of the simulation
+    A_hat, all_cbd_bytes, t_hat_oracle, s_hat_oracle, _ = get_oracle(6000)
 
     # Preload A_hat
     await preload_a_hat(dut, A_hat)
@@ -181,21 +245,19 @@ async def test_keygen_basic(dut):
     # Run keygen
     await run_keygen(dut, all_cbd_bytes)
 
-    # Compute oracle results
-    t_hat_oracle, s_hat_oracle = keygen_inner(A_hat, s_noise, e_noise)
+    # Read t_hat[0..2] (slots 0, 3, 6) and s_hat[0..2] (slots 9-11) in one burst
+    t_hat_slots = [0, 3, 6]
+    results = await read_polys(dut, t_hat_slots + [9, 10, 11])
 
     # Verify t_hat[0..2] in slots 0, 3, 6
     total_errors = 0
-    t_hat_slots = [0, 3, 6]
     for idx, slot in enumerate(t_hat_slots):
-        result = await read_poly(dut, slot)
-        errors = compare_polys(result, t_hat_oracle[idx], f"t_hat[{idx}] (slot {slot})", dut._log)
+        errors = compare_polys(results[idx], t_hat_oracle[idx], f"t_hat[{idx}] (slot {slot})", dut._log)
         total_errors += errors
 
     # Verify s_hat[0..2] in slots 9-11
     for i in range(3):
-        result = await read_poly(dut, 9 + i)
-        errors = compare_polys(result, s_hat_oracle[i], f"s_hat[{i}] (slot {9+i})", dut._log)
+        errors = compare_polys(results[3 + i], s_hat_oracle[i], f"s_hat[{i}] (slot {9+i})", dut._log)
         total_errors += errors
 
     assert total_errors == 0, f"KeyGen basic: {total_errors} total mismatches"
@@ -207,19 +269,17 @@ async def test_keygen_s_hat_preservation(dut):
     """Verify s_hat slots (9-11) survive through matmul phases (read-only)."""
     await init(dut)
 
-    rng = random.Random(6001)
-    A_hat, _, all_cbd_bytes, s_noise, e_noise = setup_keygen_inputs(rng)
+    # s_hat = NTT(s_noise)
+    A_hat, all_cbd_bytes, _, s_hat_oracle, _ = get_oracle(6001)
 
     await preload_a_hat(dut, A_hat)
     await run_keygen(dut, all_cbd_bytes)
 
-    # s_hat = NTT(s_noise)
-    s_hat_oracle = [ntt_forward(s_noise[i]) for i in range(3)]
+    results = await read_polys(dut, [9, 10, 11])
 
     total_errors = 0
     for i in range(3):
-        result = await read_poly(dut, 9 + i)
-        errors = compare_polys(result, s_hat_oracle[i], f"s_hat[{i}] (slot {9+i})", dut._log)
+        errors = compare_polys(results[i], s_hat_oracle[i], f"s_hat[{i}] (slot {9+i})", dut._log)
         total_errors += errors
 
     assert total_errors == 0, f"s_hat preservation: {total_errors} mismatches"
@@ -229,15 +289,16 @@ async def test_keygen_s_hat_preservation(dut):
 @cocotb.test()
 async def test_keygen_two_runs(dut):
     """Run keygen twice with different seeds, verify different outputs."""
+    # Both oracles up front, so no Python oracle work sits between the runs
+    A_hat1, cbd1, t_hat1_oracle, _, _ = get_oracle(6002)
+    A_hat2, cbd2, t_hat2_oracle, _, _ = get_oracle(6003)
+
     await init(dut)
 
     # First run
-    rng1 = random.Random(6002)
-    A_hat1, _, cbd1, s1, e1 = setup_keygen_inputs(rng1)
     await preload_a_hat(dut, A_hat1)
     await run_keygen(dut, cbd1)
 
-    t_hat1_oracle, s_hat1_oracle = keygen_inner(A_hat1, s1, e1)
     t1_hw = await read_poly(dut, 0)
 
     total_errors = 0
@@ -245,12 +306,9 @@ async def test_keygen_two_runs(dut):
     assert total_errors == 0, f"First run: {total_errors} mismatches"
 
     # Second run with different inputs
-    rng2 = random.Random(6003)
-    A_hat2, _, cbd2, s2, e2 = setup_keygen_inputs(rng2)
     await preload_a_hat(dut, A_hat2)
     await run_keygen(dut, cbd2)
 
-    t_hat2_oracle, s_hat2_oracle = keygen_inner(A_hat2, s2, e2)
     t2_hw = await read_poly(dut, 0)
 
     total_errors = 0
@@ -269,14 +327,13 @@ async def test_keygen_idle_after_done(dut):
     """Verify host I/O works after keygen completes."""
     await init(dut)
 
-    rng = random.Random(6004)
-    A_hat, _, all_cbd_bytes, s_noise, e_noise = setup_keygen_inputs(rng)
+    A_hat, all_cbd_bytes, _, _, _ = get_oracle(6004)
 
     await preload_a_hat(dut, A_hat)
     await run_keygen(dut, all_cbd_bytes)
 
     # Write a known polynomial to a free slot and read it back
-    test_poly = gen_random_poly(rng)
+    test_poly = gen_random_poly(random.Random(6006))
     await write_poly(dut, 15, test_poly)  # slot 15 is unused
     result = await read_poly(dut, 15)
 
@@ -290,19 +347,17 @@ async def test_keygen_e_hat_preservation(dut):
     """Verify e_hat (slots 12-14) not corrupted by matmul (only read, never written)."""
     await init(dut)
 
-    rng = random.Random(6005)
-    A_hat, _, all_cbd_bytes, s_noise, e_noise = setup_keygen_inputs(rng)
+    # e_hat = NTT(e_noise)
+    A_hat, all_cbd_bytes, _, _, e_hat_oracle = get_oracle(6005)
 
     await preload_a_hat(dut, A_hat)
     await run_keygen(dut, all_cbd_bytes)
 
-    # e_hat = NTT(e_noise)
-    e_hat_oracle = [ntt_forward(e_noise[i]) for i in range(3)]
+    results = await read_polys(dut, [12, 13, 14])
 
     total_errors = 0
     for i in range(3):
-        result = await read_poly(dut, 12 + i)
-        errors = compare_polys(result, e_hat_oracle[i], f"e_hat[{i}] (slot {12+i})", dut._log)
+        errors = compare_polys(results[i], e_hat_oracle[i], f"e_hat[{i}] (slot {12+i})", dut._log)
         total_errors += errors
 
     assert total_errors == 0, f"e_hat preservation: {total_errors} mismatches"
@@ -1,26 +1,27 @@
 """Testbench for kyber_top module.
 
 Tests 20-slot polynomial RAM bank with host I/O (6 existing tests)
-plus micro-op command interface (10 new tests):
-  7.  NTT forward — verify against ntt_forward() oracle
+plus micro-op command interface (8 new tests):
+  7.  NTT forward (fused NTT_WITH_COPY) — verify against ntt_forward() oracle
   8.  NTT/INTT round-trip — recover original polynomial
   9.  Basemul — verify against poly_basemul() oracle
   10. Poly add — verify against poly_add() oracle
   11. Poly sub — verify against poly_sub() oracle
-  12. Compress D=1 round-trip
-  13. Compress D=4 round-trip
-  14. Compress D=10 round-trip
-  15. CBD sample — verify against cbd_sample_eta2() oracle
-  16. Multi-op: NTT + basemul + INTT (schoolbook round-trip)
+  12. Compress/decompress round-trip for D=1, 4, 10
+  13. CBD sample — verify against cbd_sample_eta2() oracle
+  14. Multi-op: NTT + basemul + INTT (schoolbook round-trip)
+
+Test 8 keeps the separate COPY_TO_NTT / RUN_NTT / COPY_FROM_NTT ops covered.
 """
 
 import sys
 import os
 import random
+import itertools
+import operator
 
 import cocotb
-from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, ReadOnly, SimTimeoutError, with_timeout
 
 # Add ref/ to path for oracle functions
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
@@ -28,11 +29,11 @@ from kyber_math import (
     KYBER_Q, KYBER_N,
     ntt_forward, ntt_inverse, poly_basemul as oracle_basemul,
     poly_add as oracle_add, poly_sub as oracle_sub,
-    compress_q, decompress_q, cbd_sample_eta2, schoolbook_mul,
+    poly_compress, poly_decompress, cbd_sample_eta2, schoolbook_mul,
 )
 
 NUM_SLOTS = 20
-CLK_PERIOD_NS = 10
+CLK_PERIOD_NS = 10  # Must match the wrapper's always #5 clock
 
 # Opcodes (must match kyber_top.v localparams)
 OP_NOP           = 0
@@ -48,11 +49,11 @@ OP_POLY_SUB      = 9
 OP_COMPRESS      = 10
 OP_DECOMPRESS    = 11
 OP_CBD_SAMPLE    = 12
+OP_NTT_WITH_COPY = 13
 
 
 async def init(dut):
-    """Start clock, assert reset, release."""
-    cocotb.start_soon(Clock(dut.clk, CLK_PERIOD_NS, unit='ns').start())
+    """Assert reset, release. The clock is generated by the HDL wrapper."""
     dut.rst_n.value = 0
     dut.host_we.value = 0
     dut.host_slot.value = 0
@@ -71,28 +72,48 @@ async def init(dut):
     await RisingEdge(dut.clk)
 
 
-async def write_poly(dut, slot, coeffs):
-    """Write 256 coefficients to a slot via host interface."""
-    for addr in range(KYBER_N):
-        dut.host_we.value = 1
+async def write_polys(dut, writes):
+    """Burst-write (slot, coeffs) pairs via host interface, one beat per cycle."""
+    host_addr, host_din = dut.host_addr, dut.host_din
+    clk_rise = RisingEdge(dut.clk)
+    dut.host_we.value = 1
+    for slot, coeffs in writes:
         dut.host_slot.value = slot
-        dut.host_addr.value = addr
-        dut.host_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
+        for addr in range(KYBER_N):
+            host_addr.value = addr
+            host_din.value = coeffs[addr]
+            await clk_rise
     dut.host_we.value = 0
+
+
+async def write_poly(dut, slot, coeffs):
+    """Write 256 coefficients to a slot via host interface."""
+    await write_polys(dut, [(slot, coeffs)])
+
+
+async def read_polys(dut, slots):
+    """Read 256 coefficients from each slot in one back-to-back burst."""
+    host_slot, host_addr, host_dout = dut.host_slot, dut.host_addr, dut.host_dout
+    clk_fall = FallingEdge(dut.clk)
+    results = [[0] * KYBER_N for _ in slots]
+    host_slot.value = slots[0]
+    host_addr.value = 0
     await RisingEdge(dut.clk)
+    for n, result in enumerate(results):
+        for addr in range(1, KYBER_N + 1):
+            await clk_fall
+            result[addr - 1] = host_dout.value.to_unsigned()
+            if addr < KYBER_N:
+                host_addr.value = addr
+        if n + 1 < len(slots):
+            host_slot.value = slots[n + 1]
+            host_addr.value = 0
+    return results
 
 
 async def read_poly(dut, slot):
-    """Read 256 coefficients from a slot (synchronous RAM: sample on FallingEdge)."""
-    result = []
-    for addr in range(KYBER_N):
-        dut.host_slot.value = slot
-        dut.host_addr.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result.append(dut.host_dout.value.to_unsigned())
-    return result
+    """Read 256 coefficients from a slot via host interface."""
+    return (await read_polys(dut, [slot]))[0]
 
 
 async def write_coeff(dut, slot, addr, val):
@@ -115,6 +136,19 @@ async def read_coeff(dut, slot, addr):
     return dut.host_dout.value.to_unsigned()
 
 
+async def wait_done(dut, timeout):
+    """Wait for the one-cycle done pulse, or fail after timeout cycles.
+
+    Sleeps on RisingEdge(done) under a sim-time timeout instead of polling
+    done every cycle. Returns True if done fired.
+    """
+    try:
+        await with_timeout(RisingEdge(dut.done), timeout * CLK_PERIOD_NS, 'ns')
+    except SimTimeoutError:
+        return False
+    return True
+
+
 async def run_cmd(dut, op, slot_a=0, slot_b=0, param=0, timeout=50000):
     """Issue a micro-op command and wait for done."""
     dut.cmd_op.value = op
@@ -125,12 +159,8 @@ async def run_cmd(dut, op, slot_a=0, slot_b=0, param=0, timeout=50000):
     await RisingEdge(dut.clk)
     dut.start.value = 0
 
-    for _ in range(timeout):
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        if dut.done.value == 1:
-            return
-    raise TimeoutError(f"Micro-op {op} did not complete within {timeout} cycles")
+    if not await wait_done(dut, timeout):
+        raise TimeoutError(f"Micro-op {op} did not complete within {timeout} cycles")
 
 
 async def run_cbd_cmd(dut, slot, input_bytes, timeout=5000):
@@ -143,48 +173,62 @@ async def run_cbd_cmd(dut, slot, input_bytes, timeout=5000):
     await RisingEdge(dut.clk)
     dut.start.value = 0
 
-    # Feed 128 bytes via valid/ready handshake.
-    # We check byte_ready at FallingEdge (pre-posedge setup): if ready=1 when
-    # valid=1 and data is stable, the byte WILL be accepted on the next posedge.
-    # This avoids the last-byte issue where the sampler transitions to S_DONE
-    # on the accepting posedge, dropping byte_ready before we can sample it.
+    # Feed 128 bytes via valid/ready handshake. valid is held high and ready
+    # is sampled in ReadOnly before the accepting posedge: if ready=1 there,
+    # the byte WILL be accepted on that edge. Sampling before the edge avoids
+    # the last-byte issue where the sampler transitions to S_DONE on the
+    # accepting posedge, dropping byte_ready before we can sample it.
+    byte_data, byte_ready = dut.cbd_byte_data, dut.cbd_byte_ready
+    clk_rise, ready_rise = RisingEdge(dut.clk), RisingEdge(byte_ready)
     byte_idx = 0
-    cycle_count = 0
-    while byte_idx < 128:
+
+    async def feed():
+        nonlocal byte_idx
         dut.cbd_byte_valid.value = 1
-        dut.cbd_byte_data.value = input_bytes[byte_idx]
-        await FallingEdge(dut.clk)
-        if dut.cbd_byte_ready.value == 1:
-            # Byte will be accepted on next posedge
-            byte_idx += 1
-        await RisingEdge(dut.clk)
-        cycle_count += 1
-        if cycle_count > timeout:
-            raise TimeoutError(f"CBD byte feed timed out at byte {byte_idx}")
-    dut.cbd_byte_valid.value = 0
+        while byte_idx < 128:
+            byte_data.value = input_bytes[byte_idx]
+            await ReadOnly()
+            if byte_ready.value == 1:
+                byte_idx += 1
+                await clk_rise
+            else:
+                await ready_rise
+        dut.cbd_byte_valid.value = 0
+
+    try:
+        await with_timeout(feed(), timeout * CLK_PERIOD_NS, 'ns')
+    except SimTimeoutError:
+        raise TimeoutError(f"CBD byte feed timed out at byte {byte_idx}")
 
     # Wait for done (copy phase)
-    for _ in range(timeout):
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        if dut.done.value == 1:
-            return
-    raise TimeoutError("CBD_SAMPLE did not complete")
+    if not await wait_done(dut, timeout):
+        raise TimeoutError("CBD_SAMPLE did not complete")
 
 
 def compare_polys(got, expected, label, log, max_errors=10):
     """Compare two polynomials, return error count."""
-    errors = 0
-    for i in range(KYBER_N):
-        if got[i] != expected[i]:
-            log.error(f"FAIL {label}: coeff[{i}] = {got[i]}, expected {expected[i]}")
-            errors += 1
-            if errors >= max_errors:
-                log.error("(stopping after 10 errors)")
-                break
+    if list(got) == list(expected):
+        return 0
+    errors = sum(map(operator.ne, got, expected))
+    mismatches = (i for i in range(KYBER_N) if got[i] != expected[i])
+    for i in itertools.islice(mismatches, max_errors):
+        log.error(f"FAIL {label}: coeff[{i}] = {got[i]}, expected {expected[i]}")
+    if errors > max_errors:
+        log.error(f"(stopping after max errors; {errors} mismatches total)")
     return errors
 
 
+def gen_random_poly(rng):
+    """Generate a random polynomial in [0, q-1]."""
+    return gen_random_polys(rng, 1)[0]
+
+
+def gen_random_polys(rng, count):
+    """Generate count random polynomials in [0, q-1] from one bulk RNG draw."""
+    flat = rng.choices(range(KYBER_Q), k=count * KYBER_N)
+    return [flat[i * KYBER_N:(i + 1) * KYBER_N] for i in range(count)]
+
+
 # ═══════════════════════════════════════════════════════════════════
 # Existing host I/O tests (6 tests, unchanged)
 # ═══════════════════════════════════════════════════════════════════
@@ -195,7 +239,7 @@ async def test_write_read_single_slot(dut):
     await init(dut)
 
     rng = random.Random(42)
-    poly = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    poly = gen_random_poly(rng)
 
     await write_poly(dut, 0, poly)
     result = await read_poly(dut, 0)
@@ -211,15 +255,13 @@ async def test_all_slots_independent(dut):
     await init(dut)
 
     rng = random.Random(100)
-    polys = []
-    for s in range(NUM_SLOTS):
-        p = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-        polys.append(p)
-        await write_poly(dut, s, p)
+    polys = gen_random_polys(rng, NUM_SLOTS)
+    await write_polys(dut, list(enumerate(polys)))
+
+    results = await read_polys(dut, list(range(NUM_SLOTS)))
 
     total_errors = 0
-    for s in range(NUM_SLOTS):
-        result = await read_poly(dut, s)
+    for s, result in enumerate(results):
         for i in range(KYBER_N):
             if result[i] != polys[s][i]:
                 dut._log.error(
@@ -244,21 +286,14 @@ async def test_slot_isolation(dut):
     rng = random.Random(200)
 
     # Write known values to slots 4, 5, 6
-    poly4 = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    poly5 = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    poly6 = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    await write_poly(dut, 4, poly4)
-    await write_poly(dut, 5, poly5)
-    await write_poly(dut, 6, poly6)
+    poly4, poly5, poly6, poly5_new = gen_random_polys(rng, 4)
+    await write_polys(dut, [(4, poly4), (5, poly5), (6, poly6)])
 
     # Overwrite slot 5 with new data
-    poly5_new = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
     await write_poly(dut, 5, poly5_new)
 
     # Verify slots 4 and 6 are untouched
-    result4 = await read_poly(dut, 4)
-    result6 = await read_poly(dut, 6)
-    result5 = await read_poly(dut, 5)
+    result4, result6, result5 = await read_polys(dut, [4, 6, 5])
 
     assert result4 == poly4, "Slot 4 was corrupted by write to slot 5"
     assert result6 == poly6, "Slot 6 was corrupted by write to slot 5"
@@ -299,8 +334,7 @@ async def test_overwrite(dut):
     await init(dut)
 
     rng = random.Random(300)
-    poly_a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    poly_b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    poly_a, poly_b = gen_random_polys(rng, 2)
 
     # Write and verify A
     await write_poly(dut, 3, poly_a)
@@ -326,7 +360,7 @@ async def test_out_of_range_slot(dut):
 
     # Write something to slot 0 so we know RAM isn't all zeros
     rng = random.Random(400)
-    poly = [rng.randint(1, KYBER_Q - 1) for _ in range(KYBER_N)]
+    poly = rng.choices(range(1, KYBER_Q), k=KYBER_N)
     await write_poly(dut, 0, poly)
 
     # Read from out-of-range slots
@@ -341,26 +375,22 @@ async def test_out_of_range_slot(dut):
 
 
 # ═══════════════════════════════════════════════════════════════════
-# Micro-op tests (10 new tests)
+# Micro-op tests (8 new tests)
 # ═══════════════════════════════════════════════════════════════════
 
 @cocotb.test()
 async def test_ntt_forward(dut):
-    """Load poly to slot 0, copy to NTT, run forward NTT, copy back, verify."""
+    """Load poly to slot 0, NTT it into slot 1 with the fused op, verify."""
     await init(dut)
 
     rng = random.Random(1000)
-    poly = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    poly = gen_random_poly(rng)
 
     # Load poly into slot 0
     await write_poly(dut, 0, poly)
 
-    # COPY_TO_NTT from slot 0
-    await run_cmd(dut, OP_COPY_TO_NTT, slot_a=0)
-    # RUN_NTT forward (mode=0)
-    await run_cmd(dut, OP_RUN_NTT, param=0)
-    # COPY_FROM_NTT to slot 1
-    await run_cmd(dut, OP_COPY_FROM_NTT, slot_a=1)
+    # COPY_TO_NTT from slot 0, RUN_NTT forward (mode=0), COPY_FROM_NTT to slot 1
+    await run_cmd(dut, OP_NTT_WITH_COPY, slot_a=0, slot_b=1, param=0)
 
     # Read result from slot 1
     result = await read_poly(dut, 1)
@@ -378,7 +408,7 @@ async def test_ntt_intt_roundtrip(dut):
     await init(dut)
 
     rng = random.Random(1001)
-    poly = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    poly = gen_random_poly(rng)
 
     await write_poly(dut, 0, poly)
 
@@ -403,14 +433,12 @@ async def test_basemul(dut):
 
     rng = random.Random(1002)
     # Generate two random polys and NTT them (oracle)
-    a_time = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    b_time = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    a_time, b_time = gen_random_polys(rng, 2)
     a_ntt = ntt_forward(a_time)
     b_ntt = ntt_forward(b_time)
 
     # Load NTT-domain polys into slots 0 and 1
-    await write_poly(dut, 0, a_ntt)
-    await write_poly(dut, 1, b_ntt)
+    await write_polys(dut, [(0, a_ntt), (1, b_ntt)])
 
     # Copy to basemul A and B
     await run_cmd(dut, OP_COPY_TO_BM_A, slot_a=0)
@@ -428,24 +456,28 @@ async def test_basemul(dut):
     dut._log.info("PASS: Basemul verified against oracle")
 
 
-@cocotb.test()
-async def test_poly_add(dut):
-    """Load two polys, POLY_ADD, verify against oracle."""
-    await init(dut)
+async def check_inplace_op(dut, seed, op, oracle, label):
+    """Load two seeded polys into slots 0 and 1, run op, compare slot 0.
 
-    rng = random.Random(1003)
-    a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    POLY_ADD/POLY_SUB take slot_a=0 as both first operand and destination
+    (slot_a op slot_b). Returns the mismatch count against oracle(a, b).
+    """
+    await init(dut)
 
-    await write_poly(dut, 0, a)
-    await write_poly(dut, 1, b)
+    rng = random.Random(seed)
+    a, b = gen_random_polys(rng, 2)
 
-    # POLY_ADD: slot_a=0 (dst, a+b), slot_b=1 (src)
-    await run_cmd(dut, OP_POLY_ADD, slot_a=0, slot_b=1)
+    await write_polys(dut, [(0, a), (1, b)])
+    await run_cmd(dut, op, slot_a=0, slot_b=1)
 
     result = await read_poly(dut, 0)
-    expected = oracle_add(a, b)
-    errors = compare_polys(result, expected, "poly_add", dut._log)
+    return compare_polys(result, oracle(a, b), label, dut._log)
+
+
+@cocotb.test()
+async def test_poly_add(dut):
+    """Load two polys, POLY_ADD, verify against oracle."""
+    errors = await check_inplace_op(dut, 1003, OP_POLY_ADD, oracle_add, "poly_add")
     assert errors == 0, f"Poly add: {errors} mismatches"
     dut._log.info("PASS: Polynomial addition verified against oracle")
 
@@ -453,110 +485,50 @@ async def test_poly_add(dut):
 @cocotb.test()
 async def test_poly_sub(dut):
     """Load two polys, POLY_SUB, verify against oracle."""
-    await init(dut)
-
-    rng = random.Random(1004)
-    a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-
-    await write_poly(dut, 0, a)
-    await write_poly(dut, 1, b)
-
-    # POLY_SUB: slot_a=0 (dst, a-b), slot_b=1 (src)
-    await run_cmd(dut, OP_POLY_SUB, slot_a=0, slot_b=1)
-
-    result = await read_poly(dut, 0)
-    expected = oracle_sub(a, b)
-    errors = compare_polys(result, expected, "poly_sub", dut._log)
+    errors = await check_inplace_op(dut, 1004, OP_POLY_SUB, oracle_sub, "poly_sub")
     assert errors == 0, f"Poly sub: {errors} mismatches"
     dut._log.info("PASS: Polynomial subtraction verified against oracle")
 
 
 @cocotb.test()
-async def test_compress_d1(dut):
-    """Compress D=1, decompress D=1, verify round-trip."""
+async def test_compress_roundtrip(dut):
+    """Compress then decompress for D=1, 4, 10, verify both against oracle.
+
+    All three source polynomials are loaded in one burst after a single
+    reset. Each D uses its own slot triple (src, compressed, decompressed)
+    so nothing is overwritten, and all six results are read in one burst.
+    The compressed slot must be checked directly: decompress only sees its
+    low D bits, so a wrong upper bit would not show up after the round trip.
+    """
     await init(dut)
 
-    rng = random.Random(1005)
-    poly = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-
-    await write_poly(dut, 0, poly)
+    # (D, seed, src slot): compressed in src+1, decompressed in src+2
+    cases = [(1, 1005, 0), (4, 1006, 3), (10, 1007, 6)]
+    polys = {}
+    for d, seed, src in cases:
+        rng = random.Random(seed)
+        polys[d] = gen_random_poly(rng)
 
-    # Compress slot 0 → slot 1 (D=1)
-    await run_cmd(dut, OP_COMPRESS, slot_a=0, slot_b=1, param=1)
+    await write_polys(dut, [(src, polys[d]) for d, _, src in cases])
 
-    # Read compressed values
-    compressed = await read_poly(dut, 1)
+    for d, _, src in cases:
+        await run_cmd(dut, OP_COMPRESS, slot_a=src, slot_b=src + 1, param=d)
+        await run_cmd(dut, OP_DECOMPRESS, slot_a=src + 1, slot_b=src + 2, param=d)
 
-    # Verify compressed values against oracle
-    expected_compressed = [compress_q(c, 1) for c in poly]
-    errors = compare_polys(compressed, expected_compressed, "compress_d1", dut._log)
-    assert errors == 0, f"Compress D=1: {errors} mismatches"
+    results = await read_polys(dut, [src + k for _, _, src in cases for k in (1, 2)])
 
-    # Decompress slot 1 → slot 2 (D=1)
-    await run_cmd(dut, OP_DECOMPRESS, slot_a=1, slot_b=2, param=1)
-    decompressed = await read_poly(dut, 2)
-
-    expected_decompressed = [decompress_q(compress_q(c, 1), 1) for c in poly]
-    errors = compare_polys(decompressed, expected_decompressed, "decompress_d1", dut._log)
-    assert errors == 0, f"Decompress D=1: {errors} mismatches"
-    dut._log.info("PASS: Compress/decompress D=1 round-trip verified")
-
-
-@cocotb.test()
-async def test_compress_d4(dut):
-    """Compress D=4, decompress D=4, verify round-trip."""
-    await init(dut)
-
-    rng = random.Random(1006)
-    poly = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-
-    await write_poly(dut, 0, poly)
+    for n, (d, _, _) in enumerate(cases):
+        compressed, decompressed = results[2 * n], results[2 * n + 1]
 
-    # Compress → slot 1
-    await run_cmd(dut, OP_COMPRESS, slot_a=0, slot_b=1, param=4)
-    compressed = await read_poly(dut, 1)
+        expected_compressed = poly_compress(polys[d], d)
+        errors = compare_polys(compressed, expected_compressed, f"compress_d{d}", dut._log)
+        assert errors == 0, f"Compress D={d}: {errors} mismatches"
 
-    expected_compressed = [compress_q(c, 4) for c in poly]
-    errors = compare_polys(compressed, expected_compressed, "compress_d4", dut._log)
-    assert errors == 0, f"Compress D=4: {errors} mismatches"
+        expected_decompressed = poly_decompress(expected_compressed, d)
+        errors = compare_polys(decompressed, expected_decompressed, f"decompress_d{d}", dut._log)
+        assert errors == 0, f"Decompress D={d}: {errors} mismatches"
 
-    # Decompress → slot 2
-    await run_cmd(dut, OP_DECOMPRESS, slot_a=1, slot_b=2, param=4)
-    decompressed = await read_poly(dut, 2)
-
-    expected_decompressed = [decompress_q(compress_q(c, 4), 4) for c in poly]
-    errors = compare_polys(decompressed, expected_decompressed, "decompress_d4", dut._log)
-    assert errors == 0, f"Decompress D=4: {errors} mismatches"
-    dut._log.info("PASS: Compress/decompress D=4 round-trip verified")
-
-
-@cocotb.test()
-async def test_compress_d10(dut):
-    """Compress D=10, decompress D=10, verify round-trip."""
-    await init(dut)
-
-    rng = random.Random(1007)
-    poly = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-
-    await write_poly(dut, 0, poly)
-
-    # Compress → slot 1
-    await run_cmd(dut, OP_COMPRESS, slot_a=0, slot_b=1, param=10)
-    compressed = await read_poly(dut, 1)
-
-    expected_compressed = [compress_q(c, 10) for c in poly]
-    errors = compare_polys(compressed, expected_compressed, "compress_d10", dut._log)
-    assert errors == 0, f"Compress D=10: {errors} mismatches"
-
-    # Decompress → slot 2
-    await run_cmd(dut, OP_DECOMPRESS, slot_a=1, slot_b=2, param=10)
-    decompressed = await read_poly(dut, 2)
-
-    expected_decompressed = [decompress_q(compress_q(c, 10), 10) for c in poly]
-    errors = compare_polys(decompressed, expected_decompressed, "decompress_d10", dut._log)
-    assert errors == 0, f"Decompress D=10: {errors} mismatches"
-    dut._log.info("PASS: Compress/decompress D=10 round-trip verified")
+    dut._log.info("PASS: Compress/decompress D=1, 4, 10 round-trips verified")
 
 
 @cocotb.test()
@@ -565,7 +537,7 @@ async def test_cbd_sample(dut):
     await init(dut)
 
     rng = random.Random(1008)
-    input_bytes = [rng.randint(0, 255) for _ in range(128)]
+    input_bytes = rng.randbytes(128)
 
     await run_cbd_cmd(dut, slot=3, input_bytes=input_bytes)
 
@@ -583,22 +555,14 @@ async def test_multi_op_sequence(dut):
     await init(dut)
 
     rng = random.Random(1009)
-    a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    a, b = gen_random_polys(rng, 2)
 
     # Load time-domain polys
-    await write_poly(dut, 0, a)
-    await write_poly(dut, 1, b)
+    await write_polys(dut, [(0, a), (1, b)])
 
-    # NTT(a) → slot 0 via NTT engine
-    await run_cmd(dut, OP_COPY_TO_NTT, slot_a=0)
-    await run_cmd(dut, OP_RUN_NTT, param=0)
-    await run_cmd(dut, OP_COPY_FROM_NTT, slot_a=2)  # NTT(a) in slot 2
-
-    # NTT(b) → slot 1 via NTT engine
-    await run_cmd(dut, OP_COPY_TO_NTT, slot_a=1)
-    await run_cmd(dut, OP_RUN_NTT, param=0)
-    await run_cmd(dut, OP_COPY_FROM_NTT, slot_a=3)  # NTT(b) in slot 3
+    # NTT(a) → slot 2, NTT(b) → slot 3 via the fused NTT op
+    await run_cmd(dut, OP_NTT_WITH_COPY, slot_a=0, slot_b=2, param=0)
+    await run_cmd(dut, OP_NTT_WITH_COPY, slot_a=1, slot_b=3, param=0)
 
     # Basemul: NTT(a) * NTT(b)
     await run_cmd(dut, OP_COPY_TO_BM_A, slot_a=2)
@@ -607,9 +571,7 @@ async def test_multi_op_sequence(dut):
     await run_cmd(dut, OP_COPY_FROM_BM, slot_a=4)  # product in NTT domain in slot 4
 
     # INTT(product) → slot 5
-    await run_cmd(dut, OP_COPY_TO_NTT, slot_a=4)
-    await run_cmd(dut, OP_RUN_NTT, param=1)  # inverse NTT
-    await run_cmd(dut, OP_COPY_FROM_NTT, slot_a=5)
+    await run_cmd(dut, OP_NTT_WITH_COPY, slot_a=4, slot_b=5, param=1)  # inverse NTT
 
     result = await read_poly(dut, 5)
 
@@ -14,15 +14,42 @@ from cocotb.triggers import Timer
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
 from kyber_math import KYBER_Q, mod_q
 
+_SETTLE = Timer(1, unit='ns')  # shared settle trigger for every (a, b) drive
 
-async def drive_and_check(dut, a, b):
-    """Drive inputs, wait for combinational propagation, return (result, expected, match)."""
-    expected = mod_q(a - b)
-    dut.a.value = a
-    dut.b.value = b
-    await Timer(1, unit='ns')
-    result = dut.result.value.to_unsigned()
-    return result, expected, result == expected
+# Random (a, b) pairs per run; EXHAUSTIVE=1 restores the full 100k sweep
+N_RANDOM = 100_000 if os.environ.get("EXHAUSTIVE") == "1" else 4096
+
+# Single-bit operands plus the a - b borrow boundaries at 0, q/2 and q-1
+DIRECTED = sorted(
+    {1 << k for k in range(12)}
+    | {0, 1, 2, KYBER_Q // 2 - 1, KYBER_Q // 2, KYBER_Q // 2 + 1, KYBER_Q - 2, KYBER_Q - 1}
+)
+
+
+async def check_pairs(dut, pairs, expected, label):
+    """Drive each (a, b) pair and compare against a precomputed expected list.
+
+    Signal handles are hoisted out of the loop and _SETTLE is reused; the
+    per-pair Python work is one write of each input, one read and one
+    list lookup. Returns the error count.
+    """
+    a_sig, b_sig, result_sig = dut.a, dut.b, dut.result
+    errors = 0
+    for (a, b), exp in zip(pairs, expected):
+        a_sig.value = a
+        b_sig.value = b
+        await _SETTLE
+        result = result_sig.value.to_unsigned()
+        if result != exp:
+            dut._log.error(f"FAIL: {label} mod_sub({a}, {b}) = {result}, expected {exp}")
+            errors += 1
+    return errors
+
+
+# Exhaustive slice oracles: a - 0 = a, 0 - b = -b mod q, a - a = 0
+EXPECTED_A = list(range(KYBER_Q))
+EXPECTED_B = [mod_q(-b) for b in range(KYBER_Q)]
+EXPECTED_DIAG = [0] * KYBER_Q
 
 
 @cocotb.test()
@@ -33,28 +60,10 @@ async def test_exhaustive_slices(dut):
     - b varies [0, q-1] with a=0
     - diagonal a=b for all [0, q-1]
     """
-    errors = 0
-
-    # a varies, b=0
-    for a in range(KYBER_Q):
-        result, expected, match = await drive_and_check(dut, a, 0)
-        if not match:
-            dut._log.error(f"FAIL: mod_sub({a}, 0) = {result}, expected {expected}")
-            errors += 1
-
-    # b varies, a=0
-    for b in range(KYBER_Q):
-        result, expected, match = await drive_and_check(dut, 0, b)
-        if not match:
-            dut._log.error(f"FAIL: mod_sub(0, {b}) = {result}, expected {expected}")
-            errors += 1
-
-    # diagonal a=b (should always be 0)
-    for a in range(KYBER_Q):
-        result, expected, match = await drive_and_check(dut, a, a)
-        if not match:
-            dut._log.error(f"FAIL: mod_sub({a}, {a}) = {result}, expected {expected}")
-            errors += 1
+    coeffs = range(KYBER_Q)
+    errors = await check_pairs(dut, zip(coeffs, [0] * KYBER_Q), EXPECTED_A, "a-axis")
+    errors += await check_pairs(dut, zip([0] * KYBER_Q, coeffs), EXPECTED_B, "b-axis")
+    errors += await check_pairs(dut, zip(coeffs, coeffs), EXPECTED_DIAG, "diagonal")
 
     total = 3 * KYBER_Q
     assert errors == 0, f"Exhaustive slices: {errors} errors out of {total}"
@@ -76,14 +85,8 @@ async def test_boundary_values(dut):
         (KYBER_Q // 2, KYBER_Q // 2),   # 0
         (KYBER_Q // 2 + 1, KYBER_Q // 2),  # 1
     ]
-    errors = 0
-    for a, b in cases:
-        result, expected, match = await drive_and_check(dut, a, b)
-        if not match:
-            dut._log.error(f"FAIL: mod_sub({a}, {b}) = {result}, expected {expected}")
-            errors += 1
-        else:
-            dut._log.info(f"  mod_sub({a}, {b}) = {expected}")
+    expected = [mod_q(a - b) for a, b in cases]
+    errors = await check_pairs(dut, cases, expected, "boundary")
 
     assert errors == 0, f"Boundary test: {errors} errors out of {len(cases)}"
     dut._log.info(f"PASS: All {len(cases)} boundary cases verified")
@@ -91,18 +94,18 @@ async def test_boundary_values(dut):
 
 @cocotb.test()
 async def test_random_pairs(dut):
-    """100k random (a, b) pairs in [0, q-1]."""
+    """Directed pairs plus uniform random (a, b) pairs in [0, q-1].
+
+    Every pair of DIRECTED values is driven, then N_RANDOM uniform pairs.
+    """
     rng = random.Random(42)
-    n_samples = 100_000
-    errors = 0
 
-    for _ in range(n_samples):
-        a = rng.randint(0, KYBER_Q - 1)
-        b = rng.randint(0, KYBER_Q - 1)
-        result, expected, match = await drive_and_check(dut, a, b)
-        if not match:
-            dut._log.error(f"FAIL: mod_sub({a}, {b}) = {result}, expected {expected}")
-            errors += 1
+    # One bulk draw for all operands; the oracle is a single pass over them
+    vals = rng.choices(range(KYBER_Q), k=2 * N_RANDOM)
+    pairs = [(a, b) for a in DIRECTED for b in DIRECTED]
+    pairs += zip(vals[0::2], vals[1::2])
+    expected = [mod_q(a - b) for a, b in pairs]
+    errors = await check_pairs(dut, pairs, expected, "random")
 
-    assert errors == 0, f"Random test: {errors} errors out of {n_samples}"
-    dut._log.info(f"PASS: {n_samples} random pairs verified")
+    assert errors == 0, f"Random test: {errors} errors out of {len(pairs)}"
+    dut._log.info(f"PASS: {len(pairs)} directed + random pairs verified")
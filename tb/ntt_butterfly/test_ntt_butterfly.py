@@ -18,6 +18,17 @@ from cocotb.triggers import Timer
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
 from kyber_math import KYBER_Q, ntt_butterfly, mod_q
 
+_SETTLE = Timer(1, unit='ns')  # butterfly output settle, reused across triples
+
+# Random (even, odd, zeta) triples per run; EXHAUSTIVE=1 runs 100k
+N_RANDOM = 100_000 if os.environ.get("EXHAUSTIVE") == "1" else 4096
+
+# Values swept on each of even/odd/zeta: single bits, 0, q/2 and q-1 edges
+DIRECTED = sorted(
+    {1 << k for k in range(12)}
+    | {0, 1, 2, KYBER_Q // 2 - 1, KYBER_Q // 2, KYBER_Q // 2 + 1, KYBER_Q - 2, KYBER_Q - 1}
+)
+
 
 async def drive_and_check(dut, even, odd, zeta):
     """Drive inputs, wait, return (even_out, odd_out, exp_even, exp_odd, match)."""
@@ -25,13 +36,39 @@ async def drive_and_check(dut, even, odd, zeta):
     dut.even.value = even
     dut.odd.value = odd
     dut.zeta.value = zeta
-    await Timer(1, unit='ns')
+    await _SETTLE
     result_even = dut.even_out.value.to_unsigned()
     result_odd = dut.odd_out.value.to_unsigned()
     match = (result_even == exp_even) and (result_odd == exp_odd)
     return result_even, result_odd, exp_even, exp_odd, match
 
 
+async def check_triples(dut, triples, expected, label):
+    """Drive each (even, odd, zeta) and compare against precomputed outputs.
+
+    The oracle runs in one pass before simulation starts, the signal
+    handles are hoisted and _SETTLE is reused, so each iteration only writes
+    three inputs and reads two outputs. Returns the error count.
+    """
+    even_sig, odd_sig, zeta_sig = dut.even, dut.odd, dut.zeta
+    even_out, odd_out = dut.even_out, dut.odd_out
+    errors = 0
+    for (even, odd, zeta), (ee, eo) in zip(triples, expected):
+        even_sig.value = even
+        odd_sig.value = odd
+        zeta_sig.value = zeta
+        await _SETTLE
+        re = even_out.value.to_unsigned()
+        ro = odd_out.value.to_unsigned()
+        if re != ee or ro != eo:
+            dut._log.error(
+                f"FAIL {label}: butterfly({even}, {odd}, {zeta}) = ({re}, {ro}), "
+                f"expected ({ee}, {eo})"
+            )
+            errors += 1
+    return errors
+
+
 @cocotb.test()
 async def test_boundary_values(dut):
     """Test specific boundary and corner-case triples."""
@@ -76,29 +113,17 @@ async def test_algebraic_properties(dut):
 
     # Property 1: zeta=0 → even_out = even, odd_out = even
     # (t = 0*odd = 0, so even+0=even, even-0=even)
-    for _ in range(100):
-        even = rng.randint(0, KYBER_Q - 1)
-        odd = rng.randint(0, KYBER_Q - 1)
-        re, ro, ee, eo, match = await drive_and_check(dut, even, odd, 0)
-        if not match or re != even or ro != even:
-            dut._log.error(
-                f"FAIL zeta=0: butterfly({even}, {odd}, 0) = ({re}, {ro}), "
-                f"expected ({even}, {even})"
-            )
-            errors += 1
+    pairs = [(rng.randint(0, KYBER_Q - 1), rng.randint(0, KYBER_Q - 1)) for _ in range(100)]
+    triples = [(even, odd, 0) for even, odd in pairs]
+    errors += await check_triples(
+        dut, triples, [(even, even) for even, _, _ in triples], "zeta=0")
 
     # Property 2: odd=0 → even_out = even, odd_out = even
     # (t = zeta*0 = 0)
-    for _ in range(100):
-        even = rng.randint(0, KYBER_Q - 1)
-        zeta = rng.randint(0, KYBER_Q - 1)
-        re, ro, ee, eo, match = await drive_and_check(dut, even, 0, zeta)
-        if not match or re != even or ro != even:
-            dut._log.error(
-                f"FAIL odd=0: butterfly({even}, 0, {zeta}) = ({re}, {ro}), "
-                f"expected ({even}, {even})"
-            )
-            errors += 1
+    pairs = [(rng.randint(0, KYBER_Q - 1), rng.randint(0, KYBER_Q - 1)) for _ in range(100)]
+    triples = [(even, 0, zeta) for even, zeta in pairs]
+    errors += await check_triples(
+        dut, triples, [(even, even) for even, _, _ in triples], "odd=0")
 
     # Property 3: even_out + odd_out ≡ 2*even (mod q)
     # Because (even+t) + (even-t) = 2*even
@@ -125,22 +150,19 @@ async def test_algebraic_properties(dut):
 
 @cocotb.test()
 async def test_random_triples(dut):
-    """100k random (even, odd, zeta) triples."""
+    """Directed triples plus uniform random (even, odd, zeta) triples.
+
+    Every combination of DIRECTED values is driven (this includes all
+    products of powers of two), then N_RANDOM uniform triples.
+    """
     rng = random.Random(42)
-    n_samples = 100_000
-    errors = 0
 
-    for _ in range(n_samples):
-        even = rng.randint(0, KYBER_Q - 1)
-        odd = rng.randint(0, KYBER_Q - 1)
-        zeta = rng.randint(0, KYBER_Q - 1)
-        re, ro, ee, eo, match = await drive_and_check(dut, even, odd, zeta)
-        if not match:
-            dut._log.error(
-                f"FAIL: butterfly({even}, {odd}, {zeta}) = ({re}, {ro}), "
-                f"expected ({ee}, {eo})"
-            )
-            errors += 1
+    # One bulk draw for all operands instead of three randint calls per triple
+    vals = rng.choices(range(KYBER_Q), k=3 * N_RANDOM)
+    triples = [(e, o, z) for e in DIRECTED for o in DIRECTED for z in DIRECTED]
+    triples += zip(vals[0::3], vals[1::3], vals[2::3])
+    expected = [ntt_butterfly(*t) for t in triples]
+    errors = await check_triples(dut, triples, expected, "random")
 
-    assert errors == 0, f"Random test: {errors} errors out of {n_samples}"
-    dut._log.info(f"PASS: {n_samples} random triples verified")
+    assert errors == 0, f"Random test: {errors} errors out of {len(triples)}"
+    dut._log.info(f"PASS: {len(triples)} directed + random triples verified")
@@ -10,6 +10,7 @@ Tests the complete 7-layer NTT/INTT engine:
 
 import sys
 import os
+import operator
 import random
 
 import cocotb
@@ -42,24 +43,34 @@ async def init(dut):
 
 
 async def load_poly(dut, coeffs):
-    """Load a 256-element polynomial into the engine's RAM via ext port."""
-    for addr in range(256):
-        dut.ext_we.value = 1
-        dut.ext_addr.value = addr
-        dut.ext_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
+    """Load a 256-element polynomial into the engine's RAM via ext port.
+
+    Handles and the RisingEdge trigger are hoisted; ext_we stays high for
+    the whole burst and drops without an idle cycle, since the last beat is
+    already latched on its edge.
+    """
+    ext_addr, ext_din = dut.ext_addr, dut.ext_din
+    clk_rise = RisingEdge(dut.clk)
+    dut.ext_we.value = 1
+    for addr in range(KYBER_N):
+        ext_addr.value = addr
+        ext_din.value = coeffs[addr]
+        await clk_rise
     dut.ext_we.value = 0
-    await RisingEdge(dut.clk)
 
 
 async def read_poly(dut):
-    """Read the 256-element polynomial from the engine's RAM."""
-    result = []
-    for addr in range(256):
-        dut.ext_addr.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result.append(dut.ext_dout.value.to_unsigned())
+    """Read the 256-element polynomial from the engine's RAM, one address per cycle."""
+    ext_addr, ext_dout = dut.ext_addr, dut.ext_dout
+    clk_fall = FallingEdge(dut.clk)
+    result = [0] * KYBER_N
+    ext_addr.value = 0
+    await RisingEdge(dut.clk)
+    for addr in range(1, KYBER_N + 1):
+        await clk_fall
+        result[addr - 1] = ext_dout.value.to_unsigned()
+        if addr < KYBER_N:
+            ext_addr.value = addr
     return result
 
 
@@ -158,14 +169,12 @@ async def test_round_trip(dut):
         result = await read_poly(dut)
 
         if result != poly:
-            mismatches = sum(1 for i in range(KYBER_N) if result[i] != poly[i])
+            diffs = list(map(operator.ne, result, poly))
             dut._log.error(
-                f"FAIL: Round-trip test {t}: {mismatches}/256 mismatches"
+                f"FAIL: Round-trip test {t}: {sum(diffs)}/256 mismatches"
             )
-            for i in range(KYBER_N):
-                if result[i] != poly[i]:
-                    dut._log.error(f"  [{i}]: got {result[i]}, expected {poly[i]}")
-                    break
+            i = diffs.index(True)
+            dut._log.error(f"  [{i}]: got {result[i]}, expected {poly[i]}")
             errors += 1
         else:
             dut._log.info(f"  Round-trip test {t}: PASS")
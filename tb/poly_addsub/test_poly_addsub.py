@@ -11,6 +11,8 @@ Tests coefficient-wise polynomial add/sub with mode selection:
 
 import sys
 import os
+import itertools
+import operator
 import random
 
 import cocotb
@@ -42,36 +44,43 @@ async def init(dut):
     await RisingEdge(dut.clk)
 
 
+async def load_ram(dut, we, addr_sig, din, coeffs):
+    """Burst-load a polynomial through one RAM write port, one beat per cycle.
+
+    we stays high for the whole burst and drops without an idle cycle, since
+    the last beat is already latched on its edge.
+    """
+    clk_rise = RisingEdge(dut.clk)
+    we.value = 1
+    for addr in range(KYBER_N):
+        addr_sig.value = addr
+        din.value = coeffs[addr]
+        await clk_rise
+    we.value = 0
+
+
 async def load_poly_a(dut, coeffs):
     """Load a polynomial into RAM A."""
-    for addr in range(256):
-        dut.a_we.value = 1
-        dut.a_addr.value = addr
-        dut.a_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
-    dut.a_we.value = 0
-    await RisingEdge(dut.clk)
+    await load_ram(dut, dut.a_we, dut.a_addr, dut.a_din, coeffs)
 
 
 async def load_poly_b(dut, coeffs):
     """Load a polynomial into RAM B."""
-    for addr in range(256):
-        dut.b_we.value = 1
-        dut.b_addr.value = addr
-        dut.b_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
-    dut.b_we.value = 0
-    await RisingEdge(dut.clk)
+    await load_ram(dut, dut.b_we, dut.b_addr, dut.b_din, coeffs)
 
 
 async def read_poly_a(dut):
-    """Read the polynomial from RAM A (result)."""
-    result = []
-    for addr in range(256):
-        dut.a_addr.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result.append(dut.a_dout.value.to_unsigned())
+    """Read the polynomial from RAM A (result), one address per cycle."""
+    a_addr, a_dout = dut.a_addr, dut.a_dout
+    clk_fall = FallingEdge(dut.clk)
+    result = [0] * KYBER_N
+    a_addr.value = 0
+    await RisingEdge(dut.clk)
+    for addr in range(1, KYBER_N + 1):
+        await clk_fall
+        result[addr - 1] = a_dout.value.to_unsigned()
+        if addr < KYBER_N:
+            a_addr.value = addr
     return result
 
 
@@ -95,6 +104,19 @@ async def run_addsub(dut, mode):
     return cycles
 
 
+def compare_polys(got, expected, label, log, max_errors=10):
+    """Compare two polynomials, return error count."""
+    if got == expected:
+        return 0
+    errors = sum(map(operator.ne, got, expected))
+    mismatches = (i for i in range(KYBER_N) if got[i] != expected[i])
+    for i in itertools.islice(mismatches, max_errors):
+        log.error(f"FAIL {label}: c[{i}] = {got[i]}, expected {expected[i]}")
+    if errors > max_errors:
+        log.error(f"(stopping after max errors; {errors} mismatches total)")
+    return errors
+
+
 @cocotb.test()
 async def test_random_add(dut):
     """Random polynomial pairs, add mode vs poly_add oracle."""
@@ -112,16 +134,7 @@ async def test_random_add(dut):
         await run_addsub(dut, mode=0)
         result = await read_poly_a(dut)
 
-        errors = 0
-        for i in range(KYBER_N):
-            if result[i] != expected[i]:
-                dut._log.error(
-                    f"FAIL test {t}: c[{i}] = {result[i]}, expected {expected[i]}"
-                )
-                errors += 1
-                if errors >= 10:
-                    dut._log.error("(stopping after 10 errors)")
-                    break
+        errors = compare_polys(result, expected, f"test {t}", dut._log)
 
         assert errors == 0, f"Random add test {t}: {errors} mismatches"
         dut._log.info(f"  Random add test {t}: PASS")
@@ -146,16 +159,7 @@ async def test_random_sub(dut):
         await run_addsub(dut, mode=1)
         result = await read_poly_a(dut)
 
-        errors = 0
-        for i in range(KYBER_N):
-            if result[i] != expected[i]:
-                dut._log.error(
-                    f"FAIL test {t}: c[{i}] = {result[i]}, expected {expected[i]}"
-                )
-                errors += 1
-                if errors >= 10:
-                    dut._log.error("(stopping after 10 errors)")
-                    break
+        errors = compare_polys(result, expected, f"test {t}", dut._log)
 
         assert errors == 0, f"Random sub test {t}: {errors} mismatches"
         dut._log.info(f"  Random sub test {t}: PASS")
@@ -222,13 +226,7 @@ async def test_roundtrip(dut):
     await run_addsub(dut, mode=0)
     result = await read_poly_a(dut)
 
-    errors = 0
-    for i in range(KYBER_N):
-        if result[i] != a[i]:
-            dut._log.error(f"FAIL: recovered[{i}] = {result[i]}, expected {a[i]}")
-            errors += 1
-            if errors >= 10:
-                break
+    errors = compare_polys(result, a, "recovered", dut._log)
 
     assert errors == 0, f"Round-trip test: {errors} mismatches"
     dut._log.info("PASS: Round-trip add(sub(a, b), b) == a verified")
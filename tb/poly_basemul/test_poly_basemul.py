@@ -10,11 +10,14 @@ Tests pointwise polynomial multiplication in the NTT domain:
 
 import sys
 import os
+import itertools
+import operator
 import random
 
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import RisingEdge, FallingEdge
+from cocotb.triggers import RisingEdge, FallingEdge, SimTimeoutError, with_timeout
+from cocotb.utils import get_sim_time
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'ref'))
 from kyber_math import (
@@ -26,6 +29,17 @@ from kyber_math import (
 CLK_PERIOD_NS = 10
 
 
+def gen_random_poly(rng):
+    """Generate a random polynomial in [0, q-1]."""
+    return gen_random_polys(rng, 1)[0]
+
+
+def gen_random_polys(rng, count):
+    """Generate count random polynomials in [0, q-1] from one bulk RNG draw."""
+    flat = rng.choices(range(KYBER_Q), k=count * KYBER_N)
+    return [flat[i * KYBER_N:(i + 1) * KYBER_N] for i in range(count)]
+
+
 async def init(dut):
     """Start clock, assert reset, release."""
     cocotb.start_soon(Clock(dut.clk, CLK_PERIOD_NS, unit='ns').start())
@@ -43,56 +57,74 @@ async def init(dut):
     await RisingEdge(dut.clk)
 
 
-async def load_poly_a(dut, coeffs):
-    """Load a polynomial into RAM A."""
-    for addr in range(256):
-        dut.a_we.value = 1
-        dut.a_addr.value = addr
-        dut.a_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
-    dut.a_we.value = 0
-    await RisingEdge(dut.clk)
+async def load_polys(dut, a_coeffs, b_coeffs):
+    """Load RAM A and RAM B together, one beat of each per cycle.
 
-
-async def load_poly_b(dut, coeffs):
-    """Load a polynomial into RAM B."""
-    for addr in range(256):
-        dut.b_we.value = 1
-        dut.b_addr.value = addr
-        dut.b_din.value = coeffs[addr]
-        await RisingEdge(dut.clk)
+    The two RAMs have independent write ports, so both polynomials go in
+    during the same 256 cycles. The write enables stay high for the whole
+    burst and drop without an idle cycle, since the last beat is already
+    latched on its edge.
+    """
+    a_addr, a_din = dut.a_addr, dut.a_din
+    b_addr, b_din = dut.b_addr, dut.b_din
+    clk_rise = RisingEdge(dut.clk)
+    dut.a_we.value = 1
+    dut.b_we.value = 1
+    for addr in range(KYBER_N):
+        a_addr.value = addr
+        a_din.value = a_coeffs[addr]
+        b_addr.value = addr
+        b_din.value = b_coeffs[addr]
+        await clk_rise
+    dut.a_we.value = 0
     dut.b_we.value = 0
-    await RisingEdge(dut.clk)
 
 
 async def read_poly_a(dut):
-    """Read the polynomial from RAM A (result)."""
-    result = []
-    for addr in range(256):
-        dut.a_addr.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result.append(dut.a_dout.value.to_unsigned())
+    """Read the polynomial from RAM A (result), one address per cycle."""
+    a_addr, a_dout = dut.a_addr, dut.a_dout
+    clk_fall = FallingEdge(dut.clk)
+    result = [0] * KYBER_N
+    a_addr.value = 0
+    await RisingEdge(dut.clk)
+    for addr in range(1, KYBER_N + 1):
+        await clk_fall
+        result[addr - 1] = a_dout.value.to_unsigned()
+        if addr < KYBER_N:
+            a_addr.value = addr
     return result
 
 
 async def run_basemul(dut):
-    """Start basemul and wait for done. Returns cycle count."""
+    """Start basemul and wait for done. Returns cycle count.
+
+    Waits on the rising edge of done instead of polling it every cycle, and
+    derives the cycle count from sim time.
+    """
     dut.start.value = 1
     await RisingEdge(dut.clk)
     dut.start.value = 0
+    start_ns = get_sim_time(unit='ns')
+
+    try:
+        await with_timeout(RisingEdge(dut.done), 1000 * CLK_PERIOD_NS, 'ns')
+    except SimTimeoutError:
+        raise RuntimeError("Timeout: basemul did not assert done within 1000 cycles")
+
+    return round((get_sim_time(unit='ns') - start_ns) / CLK_PERIOD_NS)
 
-    cycles = 0
-    while True:
-        await RisingEdge(dut.clk)
-        cycles += 1
-        await FallingEdge(dut.clk)
-        if dut.done.value == 1:
-            break
-        if cycles > 1000:
-            raise RuntimeError("Timeout: basemul did not assert done within 1000 cycles")
 
-    return cycles
+def compare_polys(got, expected, label, log, max_errors=10):
+    """Compare two polynomials, return error count."""
+    if got == expected:
+        return 0
+    errors = sum(map(operator.ne, got, expected))
+    mismatches = (i for i in range(KYBER_N) if got[i] != expected[i])
+    for i in itertools.islice(mismatches, max_errors):
+        log.error(f"FAIL {label}: c[{i}] = {got[i]}, expected {expected[i]}")
+    if errors > max_errors:
+        log.error(f"(stopping after max errors; {errors} mismatches total)")
+    return errors
 
 
 @cocotb.test()
@@ -103,25 +135,14 @@ async def test_random_polys(dut):
     rng = random.Random(42)
 
     for t in range(3):
-        a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-        b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+        a, b = gen_random_polys(rng, 2)
         expected = poly_basemul(a, b)
 
-        await load_poly_a(dut, a)
-        await load_poly_b(dut, b)
+        await load_polys(dut, a, b)
         await run_basemul(dut)
         result = await read_poly_a(dut)
 
-        errors = 0
-        for i in range(KYBER_N):
-            if result[i] != expected[i]:
-                dut._log.error(
-                    f"FAIL test {t}: c[{i}] = {result[i]}, expected {expected[i]}"
-                )
-                errors += 1
-                if errors >= 10:
-                    dut._log.error("(stopping after 10 errors)")
-                    break
+        errors = compare_polys(result, expected, f"test {t}", dut._log)
 
         assert errors == 0, f"Random poly test {t}: {errors} mismatches"
         dut._log.info(f"  Random poly test {t}: PASS")
@@ -136,22 +157,20 @@ async def test_known_vectors(dut):
 
     # All zeros × anything = all zeros
     a = [0] * KYBER_N
-    b = [random.Random(1).randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    await load_poly_a(dut, a)
-    await load_poly_b(dut, b)
+    b = gen_random_poly(random.Random(1))
+    await load_polys(dut, a, b)
     await run_basemul(dut)
     result = await read_poly_a(dut)
-    assert result == [0] * KYBER_N, "basemul(zeros, b) should be zeros"
+    assert not any(result), "basemul(zeros, b) should be zeros"
     dut._log.info("  basemul(zeros, b) = zeros: PASS")
 
     # Anything × all zeros = all zeros
-    a = [random.Random(2).randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    a = gen_random_poly(random.Random(2))
     b = [0] * KYBER_N
-    await load_poly_a(dut, a)
-    await load_poly_b(dut, b)
+    await load_polys(dut, a, b)
     await run_basemul(dut)
     result = await read_poly_a(dut)
-    assert result == [0] * KYBER_N, "basemul(a, zeros) should be zeros"
+    assert not any(result), "basemul(a, zeros) should be zeros"
     dut._log.info("  basemul(a, zeros) = zeros: PASS")
 
     dut._log.info("PASS: Known vector tests verified")
@@ -170,23 +189,16 @@ async def test_ntt_identity(dut):
     ntt_unit = ntt_forward(unit)
 
     rng = random.Random(77)
-    a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    a = gen_random_poly(rng)
     ntt_a = ntt_forward(a)
     expected = poly_basemul(ntt_a, ntt_unit)
 
-    await load_poly_a(dut, ntt_a)
-    await load_poly_b(dut, ntt_unit)
+    await load_polys(dut, ntt_a, ntt_unit)
     await run_basemul(dut)
     result = await read_poly_a(dut)
 
     # Verify basemul result matches oracle
-    errors = 0
-    for i in range(KYBER_N):
-        if result[i] != expected[i]:
-            dut._log.error(f"FAIL: c[{i}] = {result[i]}, expected {expected[i]}")
-            errors += 1
-            if errors >= 10:
-                break
+    errors = compare_polys(result, expected, "identity", dut._log)
 
     assert errors == 0, f"NTT identity test: {errors} mismatches"
 
@@ -205,30 +217,20 @@ async def test_schoolbook_roundtrip(dut):
     rng = random.Random(99)
 
     for t in range(3):
-        a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-        b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+        a, b = gen_random_polys(rng, 2)
 
         ntt_a = ntt_forward(a)
         ntt_b = ntt_forward(b)
         expected = schoolbook_mul(a, b)
 
-        await load_poly_a(dut, ntt_a)
-        await load_poly_b(dut, ntt_b)
+        await load_polys(dut, ntt_a, ntt_b)
         await run_basemul(dut)
         result_ntt = await read_poly_a(dut)
 
         # INTT of basemul result
         result = ntt_inverse(result_ntt)
 
-        errors = 0
-        for i in range(KYBER_N):
-            if result[i] != expected[i]:
-                dut._log.error(
-                    f"FAIL test {t}: c[{i}] = {result[i]}, expected {expected[i]}"
-                )
-                errors += 1
-                if errors >= 10:
-                    break
+        errors = compare_polys(result, expected, f"test {t}", dut._log)
 
         assert errors == 0, f"Schoolbook round-trip test {t}: {errors} mismatches"
         dut._log.info(f"  Schoolbook round-trip test {t}: PASS")
@@ -242,11 +244,9 @@ async def test_timing(dut):
     await init(dut)
 
     rng = random.Random(55)
-    a = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
-    b = [rng.randint(0, KYBER_Q - 1) for _ in range(KYBER_N)]
+    a, b = gen_random_polys(rng, 2)
 
-    await load_poly_a(dut, a)
-    await load_poly_b(dut, b)
+    await load_polys(dut, a, b)
     cycles = await run_basemul(dut)
 
     dut._log.info(f"  Basemul took {cycles} cycles")
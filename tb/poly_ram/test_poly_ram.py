@@ -1,11 +1,10 @@
 """Testbench for poly_ram module.
 
 First clocked testbench in the project. Tests:
-  1. Write-then-read via port A
-  2. Write-then-read via port B
-  3. Dual-port simultaneous access
-  4. All-address sweep
-  5. Read-first behavior (output shows old value on write cycle)
+  1. Write-then-read via ports A and B (disjoint addresses, same cycles)
+  2. Dual-port simultaneous access
+  3. All-address sweep
+  4. Read-first behavior (output shows old value on write cycle)
 
 Synchronous RAM timing (10ns clock period):
   - Drive inputs before rising edge (in the "active" phase)
@@ -33,84 +32,71 @@ async def init(dut):
 
 
 @cocotb.test()
-async def test_write_read_port_a(dut):
-    """Write values via port A, then read them back."""
+async def test_write_read_both_ports(dut):
+    """Write via both ports on the same cycles, then read both back together.
+
+    Port A owns addresses 0..15 and port B owns 16..31, so each port's
+    write and read paths are checked independently in one pass.
+    """
     await init(dut)
+    clk_rise = RisingEdge(dut.clk)
+    clk_fall = FallingEdge(dut.clk)
+
+    values_a = [(addr * 137 + 42) % 4096 for addr in range(16)]
+    values_b = [(addr * 251 + 99) % 4096 for addr in range(16)]
 
-    values = {}
+    dut.we_a.value = 1
+    dut.we_b.value = 1
     for addr in range(16):
-        val = (addr * 137 + 42) % 4096
-        values[addr] = val
-        dut.we_a.value = 1
         dut.addr_a.value = addr
-        dut.din_a.value = val
-        await RisingEdge(dut.clk)
+        dut.din_a.value = values_a[addr]
+        dut.addr_b.value = addr + 16
+        dut.din_b.value = values_b[addr]
+        await clk_rise
 
     dut.we_a.value = 0
+    dut.we_b.value = 0
 
     # Read back: set addr, wait for rising edge + falling edge to read output
     errors = 0
     for addr in range(16):
         dut.addr_a.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result = dut.dout_a.value.to_unsigned()
-        if result != values[addr]:
+        dut.addr_b.value = addr + 16
+        await clk_rise
+        await clk_fall
+        result_a = dut.dout_a.value.to_unsigned()
+        result_b = dut.dout_b.value.to_unsigned()
+        if result_a != values_a[addr]:
             dut._log.error(
-                f"FAIL port A: addr={addr}, got={result}, expected={values[addr]}"
+                f"FAIL port A: addr={addr}, got={result_a}, expected={values_a[addr]}"
             )
             errors += 1
-
-    assert errors == 0, f"Port A write/read: {errors} errors"
-    dut._log.info("PASS: Port A write-then-read (16 addresses)")
-
-
-@cocotb.test()
-async def test_write_read_port_b(dut):
-    """Write values via port B, then read them back."""
-    await init(dut)
-
-    values = {}
-    for addr in range(16):
-        val = (addr * 251 + 99) % 4096
-        values[addr] = val
-        dut.we_b.value = 1
-        dut.addr_b.value = addr
-        dut.din_b.value = val
-        await RisingEdge(dut.clk)
-
-    dut.we_b.value = 0
-
-    errors = 0
-    for addr in range(16):
-        dut.addr_b.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result = dut.dout_b.value.to_unsigned()
-        if result != values[addr]:
+        if result_b != values_b[addr]:
             dut._log.error(
-                f"FAIL port B: addr={addr}, got={result}, expected={values[addr]}"
+                f"FAIL port B: addr={addr + 16}, got={result_b}, expected={values_b[addr]}"
             )
             errors += 1
 
-    assert errors == 0, f"Port B write/read: {errors} errors"
-    dut._log.info("PASS: Port B write-then-read (16 addresses)")
+    assert errors == 0, f"Port A/B write/read: {errors} errors"
+    dut._log.info("PASS: Port A and port B write-then-read (16 addresses each)")
 
 
 @cocotb.test()
 async def test_dual_port_simultaneous(dut):
     """Write via port A, read same data via port B simultaneously."""
     await init(dut)
+    clk_rise = RisingEdge(dut.clk)
+    clk_fall = FallingEdge(dut.clk)
 
     # Fill addresses 0..7 via port A
     for addr in range(8):
         dut.we_a.value = 1
         dut.addr_a.value = addr
         dut.din_a.value = addr * 100
-        await RisingEdge(dut.clk)
+        await clk_rise
 
     dut.we_a.value = 0
-    await RisingEdge(dut.clk)  # let last write complete
+    await clk_rise  # let last write complete
 
     # Read via port B while writing new values via port A to different addresses
     errors = 0
@@ -119,8 +105,8 @@ async def test_dual_port_simultaneous(dut):
         dut.we_a.value = 1
         dut.addr_a.value = addr + 8
         dut.din_a.value = (addr + 8) * 100
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
+        await clk_rise
+        await clk_fall
 
         result = dut.dout_b.value.to_unsigned()
         expected = addr * 100
@@ -142,29 +128,41 @@ async def test_all_address_sweep(dut):
     await init(dut)
 
     rng = random.Random(42)
-    values = [rng.randint(0, 4095) for _ in range(256)]
+    values = rng.choices(range(4096), k=256)
 
-    # Write all via port A
-    for addr in range(256):
-        dut.we_a.value = 1
-        dut.addr_a.value = addr
-        dut.din_a.value = values[addr]
-        await RisingEdge(dut.clk)
+    we_a, addr_a, din_a, dout_a = dut.we_a, dut.addr_a, dut.din_a, dut.dout_a
+    clk_rise = RisingEdge(dut.clk)
+    clk_fall = FallingEdge(dut.clk)
 
-    dut.we_a.value = 0
+    # Write all via port A, we_a held high for the whole burst
+    we_a.value = 1
+    for addr in range(256):
+        addr_a.value = addr
+        din_a.value = values[addr]
+        await clk_rise
+
+    we_a.value = 0
+
+    # Read all back via port A, streaming: the next address is driven at the
+    # same falling edge that samples the current one, so every read after the
+    # first costs one clock instead of two
+    results = [0] * 256
+    addr_a.value = 0
+    await clk_rise
+    for addr in range(256):
+        await clk_fall
+        results[addr] = dout_a.value.to_unsigned()
+        if addr < 255:
+            addr_a.value = addr + 1
 
-    # Read all back via port A
     errors = 0
-    for addr in range(256):
-        dut.addr_a.value = addr
-        await RisingEdge(dut.clk)
-        await FallingEdge(dut.clk)
-        result = dut.dout_a.value.to_unsigned()
-        if result != values[addr]:
-            dut._log.error(
-                f"FAIL sweep: addr={addr}, got={result}, expected={values[addr]}"
-            )
-            errors += 1
+    if results != values:
+        for addr, (result, expected) in enumerate(zip(results, values)):
+            if result != expected:
+                dut._log.error(
+                    f"FAIL sweep: addr={addr}, got={result}, expected={expected}"
+                )
+                errors += 1
 
     assert errors == 0, f"All-address sweep: {errors}/256 errors"
     dut._log.info("PASS: All 256 addresses verified")